@@ -18,7 +18,11 @@ import argparse
 import multiprocessing
 import os
 import sys
+import threading
 import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from datetime import datetime
 from loguru import logger
@@ -29,43 +33,235 @@ from apscheduler.triggers.interval import IntervalTrigger
 log_dir = Path("./logs")
 log_dir.mkdir(exist_ok=True)
 
+# Per-account log files (created once by the orchestrator, reused by workers)
+account_log_dir = log_dir / "accounts"
+
 INTERVAL_MINUTES = 5
 
+# Upper bound on concurrently running account workers (None = one per account)
+MAX_PARALLEL_ACCOUNTS = None
+
+# Max account starts per second across all workers (spaces out exchange/LLM bursts)
+ACCOUNT_START_QPS = 0.5
+
+# Start limiter shared with worker processes (set by the pool initializer)
+_START_LIMITER = None
+
+# Worker-side queue feeding console records to the orchestrator's stdout sink
+_CONSOLE_QUEUE = None
+
+# Worker-side account configs keyed by name (handed over once by the pool initializer)
+_WORKER_ACCOUNTS = {}
+
+# Worker-side loguru state: (account, timestamp) the sinks were built for and their IDs
+_ACCOUNT_LOG_KEY = None
+_ACCOUNT_LOG_HANDLERS = []
+
+# Process start method: forkserver on Linux, spawn elsewhere (forkserver is
+# unavailable on Windows and fork is unsafe on macOS). Plain fork is not used:
+# the orchestrator already runs the console relay and loguru enqueue writer
+# threads when the pool starts, and forking a multi-threaded process can
+# deadlock children (Python 3.12 warns about it). The fork server is a clean
+# single-threaded process that preloads the trading stack once (see
+# _FORKSERVER_PRELOAD), so workers still skip re-importing langchain/exchange code.
+_START_METHOD = "forkserver" if sys.platform.startswith("linux") else "spawn"
+
+# Modules imported once by the fork server and inherited by every worker
+_FORKSERVER_PRELOAD = ["tradingagents.trading_runner"]
+
 # Global timestamp for this run (shared across all processes)
 _RUN_TIMESTAMP = None
 
+# Set while a scheduled tick is running; a tick that finds it set is skipped
+_JOB_ACTIVE = threading.Event()
+
+def _is_dev_env():
+    """
+    Whether the dev config is active.
+    
+    Extended backtraces and variable diagnostics are costly to render and bloat
+    the error logs, so they are only enabled for config.dev.yaml.
+    """
+    return os.environ.get("CONFIG_FILE", "").endswith("dev.yaml")
+
+
 def init_orchestrator_logger():
     """Initialize logger for the main orchestrator process only."""
     global _RUN_TIMESTAMP
     _RUN_TIMESTAMP = datetime.now().strftime("%Y%m%d_%H%M%S")
     
+    # Workers write here on every tick; create it once up front
+    account_log_dir.mkdir(parents=True, exist_ok=True)
+    
     logger.remove()
-    # Console output (INFO and above)
+    # Console output (INFO and above); the only stdout writer, workers forward to it
     logger.add(
         sys.stdout,
         colorize=True,
-        format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>",
-        level="INFO"
+        format=_console_format,
+        level="INFO",
+        enqueue=True,
     )
+    # File sinks are enqueued so disk writes and rotation never block the scheduler thread
     # General log file (DEBUG and above)
     logger.add(
         log_dir / f"orchestrator_{_RUN_TIMESTAMP}.log",
         rotation="1 day",
         retention="30 days",
+        compression="gz",
+        enqueue=True,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}",
-        level="DEBUG"
+        level="DEBUG",
+        filter=_is_orchestrator_record,
     )
     # Separate error log file (WARNING and above)
     logger.add(
         log_dir / f"error_{_RUN_TIMESTAMP}.log",
         rotation="1 day",
         retention="30 days",
+        compression="gz",
+        enqueue=True,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}",
         level="WARNING",
-        backtrace=True,
-        diagnose=True
+        filter=_is_orchestrator_record,
+        backtrace=_is_dev_env(),
+        diagnose=_is_dev_env()
     )
 
+
+def _console_format(record):
+    """Console format; records forwarded from workers get an account prefix."""
+    prefix = "<cyan>[{extra[account]}]</cyan> " if "account" in record["extra"] else ""
+    return prefix + "<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>\n"
+
+
+def _is_orchestrator_record(record):
+    """Keep forwarded worker records out of the orchestrator log files."""
+    return "account" not in record["extra"]
+
+
+def _drain_console_queue(console_queue):
+    """
+    Orchestrator thread: re-emit worker console records through the stdout sink.
+    
+    Workers ship (account, level, time, message, exception text) tuples instead
+    of writing to stdout themselves, so colourising and terminal writes happen in
+    one place. A None item stops the thread.
+    """
+    while True:
+        item = console_queue.get()
+        if item is None:
+            break
+        account, level, record_time, message, exception_text = item
+        if exception_text:
+            message = f"{message}\n{exception_text}"
+        try:
+            logger.bind(account=account).patch(
+                lambda r, t=record_time: r.update(time=t)
+            ).log(level, message)
+        except Exception:
+            # Never let a malformed record kill the console relay
+            pass
+
+
+class StartRateLimiter:
+    """
+    Cross-process rate limiter that spaces out account starts.
+    
+    Workers reserve the next free start slot from a shared clock value and
+    sleep until it arrives, so the orchestrator never blocks while staggering.
+    """
+    
+    def __init__(self, qps: float, ctx):
+        self.min_interval = 1.0 / qps if qps and qps > 0 else 0.0
+        self._next_slot = ctx.Value("d", 0.0)
+    
+    def acquire(self):
+        """Block until this caller's start slot is reached."""
+        if self.min_interval <= 0:
+            return
+        with self._next_slot.get_lock():
+            now = time.monotonic()
+            slot = max(now, self._next_slot.value)
+            self._next_slot.value = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class WorkerPool:
+    """
+    Persistent account worker pool that can be rebuilt after a worker crash.
+    
+    A worker that dies abruptly (OOM kill, segfault) leaves ProcessPoolExecutor
+    broken for good, so every later submit would raise BrokenProcessPool. The
+    executor is therefore recreated together with everything its initializer
+    hands to workers: the start limiter, the request weight budget, the console
+    queue and its relay thread.
+    """
+    
+    def __init__(self, max_workers, mp_context, accounts):
+        self.max_workers = max_workers
+        self.mp_context = mp_context
+        self.accounts = accounts
+        self._start()
+    
+    def _start(self):
+        """Create the console queue, its relay thread and the executor."""
+        from tradingagents.dataflows.asterdex_futures_api import create_shared_request_weight_bucket
+        
+        self.console_queue = self.mp_context.Queue()
+        self.console_relay = threading.Thread(
+            target=_drain_console_queue,
+            args=(self.console_queue,),
+            name="console-relay",
+            daemon=True,
+        )
+        self.console_relay.start()
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=self.mp_context,
+            initializer=_init_worker,
+            initargs=(
+                StartRateLimiter(ACCOUNT_START_QPS, self.mp_context),
+                self.accounts,
+                self.console_queue,
+                # The exchange limits request weight per IP, which all workers share
+                create_shared_request_weight_bucket(self.mp_context),
+            ),
+        )
+    
+    def submit(self, fn, *args):
+        """Submit a task, rebuilding the pool first if a previous worker crash broke it."""
+        try:
+            return self.executor.submit(fn, *args)
+        except BrokenProcessPool:
+            self.rebuild()
+            return self.executor.submit(fn, *args)
+    
+    def rebuild(self):
+        """Replace a broken executor (and its queue/relay) with a fresh one."""
+        logger.warning("⚠️  Worker pool is broken, rebuilding it")
+        self.shutdown(wait=False)
+        self._start()
+    
+    def shutdown(self, wait=True):
+        """Stop the executor and the console relay."""
+        self.executor.shutdown(wait=wait, cancel_futures=True)
+        self.console_queue.put(None)
+        self.console_relay.join(timeout=5)
+
+
+def _init_worker(start_limiter, accounts_config, console_queue=None, weight_bucket=None):
+    """Pool initializer: keep the shared start limiter, account configs, console queue and weight budget."""
+    global _START_LIMITER, _WORKER_ACCOUNTS, _CONSOLE_QUEUE
+    _START_LIMITER = start_limiter
+    _CONSOLE_QUEUE = console_queue
+    _WORKER_ACCOUNTS = {acc.name: acc for acc in accounts_config}
+    if weight_bucket is not None:
+        from tradingagents.dataflows.asterdex_futures_api import use_request_weight_bucket
+        use_request_weight_bucket(weight_bucket)
+
+
 def load_config(config_file="config.yaml"):
     """
     Load account configuration file.
@@ -87,9 +283,11 @@ def load_config(config_file="config.yaml"):
         set_env_from_config(config_file)
         
         # Load system config and update globals
-        global INTERVAL_MINUTES
+        global INTERVAL_MINUTES, MAX_PARALLEL_ACCOUNTS, ACCOUNT_START_QPS
         system_config = get_system_config(config_file)
         INTERVAL_MINUTES = system_config.get("interval_minutes", 5)
+        MAX_PARALLEL_ACCOUNTS = system_config.get("max_parallel_accounts")
+        ACCOUNT_START_QPS = system_config.get("account_start_qps", 0.5)
         
         return load_accounts_config(config_file)
     except FileNotFoundError as e:
@@ -103,60 +301,113 @@ def load_config(config_file="config.yaml"):
         sys.exit(1)
 
 
-def run_account_process(account_config, run_timestamp):
+def _configure_account_logger(account_name, run_timestamp):
+    """
+    Point this worker's loguru sinks at the given account's log files.
+    
+    Pool workers are reused across ticks, so sinks are only rebuilt when the
+    (account, timestamp) pair changes, and only the handlers added here are
+    removed - handler IDs no longer pile up in long-lived workers.
+    
+    Args:
+        account_name: Account name used as log prefix and file name
+        run_timestamp: Shared timestamp for this run
+    """
+    global _ACCOUNT_LOG_KEY, _ACCOUNT_LOG_HANDLERS
+    
+    key = (account_name, run_timestamp)
+    if key == _ACCOUNT_LOG_KEY:
+        return
+    
+    if _ACCOUNT_LOG_KEY is None:
+        # First run in this worker: drop loguru's default stderr handler
+        logger.remove()
+    else:
+        for handler_id in _ACCOUNT_LOG_HANDLERS:
+            logger.remove(handler_id)
+    
+    if _CONSOLE_QUEUE is not None:
+        # Console output is forwarded to the orchestrator, which owns stdout;
+        # tracebacks are rendered here since exception objects may not pickle
+        def forward_to_console(message):
+            record = message.record
+            exception = record["exception"]
+            exception_text = None
+            if exception is not None and exception.type is not None:
+                exception_text = "".join(traceback.format_exception(
+                    exception.type, exception.value, exception.traceback
+                )).rstrip()
+            _CONSOLE_QUEUE.put((
+                account_name,
+                record["level"].name,
+                record["time"],
+                record["message"],
+                exception_text,
+            ))
+        
+        console_handler = logger.add(forward_to_console, format="{message}", level="INFO")
+    else:
+        # Console output with account prefix
+        console_handler = logger.add(
+            sys.stdout,
+            colorize=True,
+            format=f"<cyan>[{account_name}]</cyan> <green>{{time:HH:mm:ss}}</green> | <level>{{level: <8}}</level> | <level>{{message}}</level>",
+            level="INFO"
+        )
+    
+    _ACCOUNT_LOG_HANDLERS = [
+        console_handler,
+        # Account-specific log file (all levels)
+        logger.add(
+            account_log_dir / f"{account_name}_{run_timestamp}.log",
+            rotation="1 day",
+            retention="30 days",
+            compression="gz",
+            enqueue=True,
+            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}",
+            level="DEBUG"
+        ),
+        # Account-specific error log
+        logger.add(
+            account_log_dir / f"{account_name}_error_{run_timestamp}.log",
+            rotation="1 day",
+            retention="30 days",
+            compression="gz",
+            enqueue=True,
+            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}",
+            level="WARNING",
+            backtrace=_is_dev_env(),
+            diagnose=_is_dev_env()
+        ),
+    ]
+    _ACCOUNT_LOG_KEY = key
+
+
+def run_account_process(account_name, run_timestamp):
     """
     Run trading strategy for a single account in a separate process.
     
     Each account gets its own dedicated log file for better isolation and traceability.
     
     Args:
-        account_config: AccountConfig object with explicit configuration
+        account_name: Name of the account; its AccountConfig was passed to the
+            worker once by the pool initializer
         run_timestamp: Shared timestamp for this run (to keep log files organized)
     """
-    account_name = account_config.name
+    account_config = _WORKER_ACCOUNTS[account_name]
     
-    # Configure account-specific logger
+    # Configure account-specific logger (no-op if this worker already did it for this run)
     from loguru import logger as account_logger
-    
-    # Create account logs directory
-    account_log_dir = Path("./logs/accounts")
-    account_log_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Remove default handlers and configure account-specific logging
-    account_logger.remove()
-    
-    # Console output with account prefix
-    account_logger.add(
-        sys.stdout,
-        colorize=True,
-        format=f"<cyan>[{account_name}]</cyan> <green>{{time:HH:mm:ss}}</green> | <level>{{level: <8}}</level> | <level>{{message}}</level>",
-        level="INFO"
-    )
-    
-    # Account-specific log file (all levels)
-    account_logger.add(
-        account_log_dir / f"{account_name}_{run_timestamp}.log",
-        rotation="1 day",
-        retention="30 days",
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}",
-        level="DEBUG"
-    )
-    
-    # Account-specific error log
-    account_logger.add(
-        account_log_dir / f"{account_name}_error_{run_timestamp}.log",
-        rotation="1 day",
-        retention="30 days",
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}",
-        level="WARNING",
-        backtrace=True,
-        diagnose=True
-    )
+    _configure_account_logger(account_name, run_timestamp)
     
     try:
         # Import trading function
         from tradingagents.trading_runner import run_trading_strategy
         
+        # Wait for this account's start slot before the first exchange/LLM call
+        if _START_LIMITER is not None:
+            _START_LIMITER.acquire()
+        
         account_logger.info(f"Starting trading for {account_config.symbol}")
         account_logger.info(f"Using LLM: {account_config.llm.model}")
         account_logger.info(f"Exchange: {account_config.exchange.base_url}")
@@ -180,110 +431,145 @@ def run_account_process(account_config, run_timestamp):
         account_logger.exception(f"Error: {e}")
         logger.error(f"[{account_name}] Error: {e}")
         return False
+    
+    finally:
+        # Drain queued file writes before handing the result back to the orchestrator
+        account_logger.complete()
 
 
-def run_all_accounts(accounts_config):
+def run_all_accounts(enabled_accounts, pool, started_at=None):
     """
-    Run all enabled accounts in parallel using multiprocessing.
+    Run all enabled accounts in parallel on the persistent worker pool.
     
     Args:
-        accounts_config: List of AccountConfig objects
+        enabled_accounts: List of enabled AccountConfig objects (filtered once at startup)
+        pool: WorkerPool created once by run_continuously
+        started_at: Pre-formatted tick time for the banner (defaults to now)
     
     Returns:
         bool: True if all accounts succeeded
     """
-    enabled_accounts = [acc for acc in accounts_config if acc.enabled]
-    
     if not enabled_accounts:
         logger.error("No enabled accounts found")
         return False
     
-    logger.info("="*80)
-    logger.info("🚀 Multi-Account Trading System")
-    logger.info("="*80)
-    logger.info(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    logger.info(f"Enabled accounts: {len(enabled_accounts)}")
+    # Build the banner as one payload so it costs a single logger dispatch; it stays
+    # a formatted record so the log file keeps its timestamp and level
+    lines = [
+        "="*80,
+        "🚀 Multi-Account Trading System",
+        "="*80,
+        f"Timestamp: {started_at or datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"Enabled accounts: {len(enabled_accounts)}",
+    ]
     
     for acc in enabled_accounts:
-        logger.info(f"  📊 {acc.name}")
-        logger.info(f"     Symbol: {acc.symbol}")
-        logger.info(f"     Model: {acc.llm.model}")
+        lines.append(f"  📊 {acc.name}")
+        lines.append(f"     Symbol: {acc.symbol}")
+        lines.append(f"     Model: {acc.llm.model}")
         if acc.description:
-            logger.info(f"     Description: {acc.description}")
+            lines.append(f"     Description: {acc.description}")
     
-    logger.info("="*80)
-    logger.info("⏳ Starting parallel execution...")
-    logger.info("="*80)
+    lines += ["="*80, "⏳ Starting parallel execution...", "="*80]
+    logger.info("\n".join(lines))
     
-    # Get shared timestamp for all processes
+    # Get shared timestamp for all workers
     global _RUN_TIMESTAMP
     
-    # Create and start processes
-    processes = []
+    # Submit one task per account to the long-lived pool. Only the account name
+    # crosses the process boundary; workers already hold the full configs.
+    futures = []
     for account_config in enabled_accounts:
-        process = multiprocessing.Process(
-            target=run_account_process,
-            args=(account_config, _RUN_TIMESTAMP),
-            name=account_config.name
-        )
-        processes.append((account_config.name, process))
-        process.start()
-        
-        # Stagger the starts to avoid API rate limits
-        time.sleep(2)
+        future = pool.submit(run_account_process, account_config.name, _RUN_TIMESTAMP)
+        futures.append((account_config.name, future))
     
-    # Wait for all processes to complete
-    logger.info(f"⏳ Waiting for {len(processes)} accounts to complete...")
+    # Wait for all accounts to complete
+    logger.info(f"⏳ Waiting for {len(futures)} accounts to complete...")
+    wait([future for _, future in futures])
     
     results = []
-    for name, process in processes:
-        process.join()
-        success = process.exitcode == 0
+    pool_broken = False
+    for name, future in futures:
+        try:
+            success = bool(future.result())
+            error = None
+        except BrokenProcessPool as e:
+            # A worker died abruptly; every pending task in the pool fails with it
+            success = False
+            error = e
+            pool_broken = True
+        except Exception as e:
+            success = False
+            error = e
         results.append((name, success))
         
         if success:
             logger.success(f"{name} finished")
+        elif error is not None:
+            logger.error(f"{name} failed (worker error: {error})")
         else:
-            logger.error(f"{name} failed (exit code: {process.exitcode})")
+            logger.error(f"{name} failed")
     
     # Print summary
-    logger.info("="*80)
-    logger.info("📊 Execution Summary")
-    logger.info("="*80)
-    
     success_count = sum(1 for _, success in results if success)
     total_count = len(results)
     
-    logger.info(f"Total accounts: {total_count}")
-    logger.info(f"Successful: {success_count}")
-    logger.info(f"Failed: {total_count - success_count}")
+    lines = [
+        "="*80,
+        "📊 Execution Summary",
+        "="*80,
+        f"Total accounts: {total_count}",
+        f"Successful: {success_count}",
+        f"Failed: {total_count - success_count}",
+    ]
     
     for name, success in results:
         status = "✅" if success else "❌"
-        logger.info(f"{status} {name}")
+        lines.append(f"{status} {name}")
     
-    logger.info("="*80)
+    lines.append("="*80)
+    logger.info("\n".join(lines))
+    
+    # Rebuild now so the next tick starts on a healthy pool
+    if pool_broken:
+        pool.rebuild()
     
     return success_count == total_count
 
 
-def scheduled_job(config):
+def scheduled_job(enabled_accounts, pool):
     """
     Job function executed by scheduler.
     
     Args:
-        config: List of AccountConfig objects
+        enabled_accounts: List of enabled AccountConfig objects
+        pool: Persistent WorkerPool shared across ticks
     """
+    # Never stack ticks: if the previous run overran, skip this one entirely
+    if _JOB_ACTIVE.is_set():
+        logger.warning("⚠️  Previous execution still running, skipping this tick")
+        return
+    _JOB_ACTIVE.set()
+    try:
+        _run_scheduled_tick(enabled_accounts, pool)
+    finally:
+        _JOB_ACTIVE.clear()
+
+
+def _run_scheduled_tick(enabled_accounts, pool):
+    """Body of scheduled_job, run while the active-tick flag is held."""
     # Update timestamp for this execution cycle
     global _RUN_TIMESTAMP
-    _RUN_TIMESTAMP = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    _RUN_TIMESTAMP = now.strftime("%Y%m%d_%H%M%S")
+    started_at = now.strftime('%Y-%m-%d %H:%M:%S')
     
     logger.info("")
     logger.info("="*80)
-    logger.info(f"⏰ Scheduled execution triggered at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info(f"⏰ Scheduled execution triggered at {started_at}")
     logger.info("="*80)
     
-    run_all_accounts(config)
+    run_all_accounts(enabled_accounts, pool, started_at)
     
     logger.info("")
     logger.info(f"✅ Execution completed. Next run in {INTERVAL_MINUTES} minutes...")
@@ -299,14 +585,27 @@ def run_continuously(config):
     # Initialize orchestrator logger first
     init_orchestrator_logger()
     
+    # Enablement is static for the lifetime of the process; filter once
+    enabled_accounts = [a for a in config if a.enabled]
+    
     logger.info("="*80)
     logger.info("🚀 AI Futures Trading System - Scheduler Started")
     logger.info("="*80)
     logger.info(f"⏰ Schedule: Every {INTERVAL_MINUTES} minutes")
-    logger.info(f"📋 Enabled accounts: {len([a for a in config if a.enabled])}")
+    logger.info(f"📋 Enabled accounts: {len(enabled_accounts)}")
+    if MAX_PARALLEL_ACCOUNTS:
+        logger.info(f"🧵 Max parallel accounts: {MAX_PARALLEL_ACCOUNTS}")
     logger.info("🛑 Press Ctrl+C to stop")
     logger.info("="*80)
     
+    # Create the worker pool once so imports and client state survive between ticks.
+    # Runs are I/O bound, so the pool can be capped below the account count to bound
+    # memory; extra accounts simply queue for the next free worker.
+    pool_size = max(len(enabled_accounts), 1)
+    if MAX_PARALLEL_ACCOUNTS:
+        pool_size = min(pool_size, int(MAX_PARALLEL_ACCOUNTS))
+    pool = WorkerPool(pool_size, multiprocessing.get_context(_START_METHOD), enabled_accounts)
+    
     # Create scheduler
     scheduler = BlockingScheduler()
     
@@ -314,15 +613,21 @@ def run_continuously(config):
     scheduler.add_job(
         func=scheduled_job,
         trigger=IntervalTrigger(minutes=INTERVAL_MINUTES),
-        args=[config],
+        args=[enabled_accounts, pool],
         id='trading_job',
         name='Trading Strategy Execution',
-        replace_existing=True
+        replace_existing=True,
+        # Collapse missed ticks into one run instead of firing a burst after an overrun,
+        # and still run a late tick if it is less than half an interval overdue.
+        # Overlapping runs stay disabled: two graphs must never trade the same account at once.
+        max_instances=1,
+        coalesce=True,
+        misfire_grace_time=INTERVAL_MINUTES * 30,
     )
     
     # Run immediately on startup
     logger.info("🔥 Running initial execution...")
-    scheduled_job(config)
+    scheduled_job(enabled_accounts, pool)
     
     # Start scheduler (blocks until interrupted)
     try:
@@ -332,7 +637,9 @@ def run_continuously(config):
     except (KeyboardInterrupt, SystemExit):
         logger.warning("\n⚠️  Shutdown signal received")
         scheduler.shutdown()
+        pool.shutdown(wait=True)
         logger.info("✅ Scheduler stopped gracefully")
+        logger.complete()
 
 
 def main():
@@ -380,8 +687,10 @@ Examples:
 
 
 if __name__ == "__main__":
-    # Required for multiprocessing on macOS/Windows
-    multiprocessing.set_start_method('spawn', force=True)
+    # spawn is required on macOS/Windows; Linux uses a preloaded fork server
+    multiprocessing.set_start_method(_START_METHOD, force=True)
+    if _START_METHOD == "forkserver":
+        multiprocessing.set_forkserver_preload(_FORKSERVER_PRELOAD)
     
     try:
         main()
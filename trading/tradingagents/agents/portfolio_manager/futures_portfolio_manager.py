@@ -5,61 +5,41 @@ Makes trading decisions based on market and risk analysis.
 Outputs a clear, structured TEXT trading plan for the trader.
 """
 
+import re
+
+from langchain_core.messages import AIMessage
 from loguru import logger
 from tradingagents.agents.utils.analysis_recorder import record_agent_execution
 
+# Marker separating the portfolio plan from the plain-language summary
+_SUMMARY_MARKER_RE = re.compile(r"###\s*💭\s*Plain Language Summary")
 
-def create_portfolio_manager(llm):
-    """
-    Construct the futures portfolio manager node.
-    
-    Args:
-        llm: Language model instance.
-        
-    Returns:
-        Portfolio manager node callable.
-    """
-    
-    def portfolio_manager_node(state):
-        symbol = state["trading_symbol"]
-        
-        # Get text reports from analysts
-        technical_research_report = state.get("technical_research_report", "")
-        risk_assessment = state.get("risk_assessment", "")
-        
-        if not technical_research_report or not risk_assessment:
-            raise ValueError("Technical research report and risk assessment are required for portfolio decisions")
-        
-        # Configure decision and order type based on test_mode
-        test_mode = state.get("test_mode")
-        
-        # Decision options
-        if test_mode and test_mode.decision:
-            # Check if single decision or multiple options
-            if "/" in test_mode.decision:
-                # Multiple options allowed
-                decision_options = f"[{test_mode.decision}]"
-                extra_instruction = f"\n6. You can only choose from {decision_options}."
-            else:
-                # Single forced decision
-                decision_options = f"[{test_mode.decision}]"
-                extra_instruction = f"\n6. ⚠️ You MUST choose {test_mode.decision}."
-        else:
-            decision_options = "[LONG/SHORT/EXIT/HOLD]"
-            extra_instruction = ""
-        
-        # Order type options
-        if test_mode and test_mode.order_type:
-            order_type_option = f"[{test_mode.order_type}]"
-            extra_instruction += f"\n7. ⚠️ Entry type MUST be {test_mode.order_type}."
-        else:
-            order_type_option = "[MARKET/LIMIT/LIMIT_BAND]"
+# Risk assessment line reporting that the account holds no position
+_NO_POSITION_RE = re.compile(r"Position-Status:\s*NONE", re.IGNORECASE)
 
-        system_decision_scope = decision_options.strip("[]")
+# Deterministic plan used when test_mode forces HOLD on a flat account
+_FORCED_HOLD_PLAN_TEMPLATE = """---
+
+## PORTFOLIO PLAN
+
+### Action
+- Decision: HOLD
+- Reasoning: Decision forced to HOLD by test_mode and no position is open.
+
+### Rationale
+Test mode restricts the decision to HOLD. With no open position there are no protective orders to update.
+
+---
 
-        context = {
-            "role": "user",
-            "content": f"""You have access to these inputs:
+### 💭 Plain Language Summary
+
+Staying out of the {symbol} market this round: test mode only allows HOLD and there is no open position to manage.
+
+---
+"""
+
+# Prompt scaffolds are static; only the placeholders change between ticks
+_CONTEXT_TEMPLATE = """You have access to these inputs:
 
 {technical_research_report}
 
@@ -135,9 +115,8 @@ Example: "I've decided to go long on Bitcoin with a $1,500 position (15% of equi
 - All prices must be realistic vs current market
 - **CRITICAL FOR HOLD**: If a position exists and you choose HOLD, you MUST still provide Stop-Loss and Take-Profit prices to ensure protective orders are current and valid
 """
-        }
-        
-        system_message = f"""You are the Portfolio Manager AI for {symbol}. Your audience is the Trader agent.
+
+_SYSTEM_TEMPLATE = """You are the Portfolio Manager AI for {symbol}. Your audience is the Trader agent.
 
 **YOUR ROLE:** Make the portfolio decision ({system_decision_scope}) based on structured inputs you receive.
 
@@ -159,37 +138,111 @@ You MUST choose **EXIT** instead of HOLD if ANY of these conditions are met:
 - All risk parameters must be realistic and specific
 
 Your decision synthesizes: market opportunity + account capacity → executable plan."""
+
+
+def create_portfolio_manager(llm):
+    """
+    Construct the futures portfolio manager node.
+    
+    Args:
+        llm: Language model instance.
+        
+    Returns:
+        Portfolio manager node callable.
+    """
+    
+    def portfolio_manager_node(state):
+        symbol = state["trading_symbol"]
+        
+        # Get text reports from analysts
+        technical_research_report = state.get("technical_research_report") or ""
+        risk_assessment = state.get("risk_assessment") or ""
+        
+        if not (technical_research_report and risk_assessment):
+            raise ValueError("Technical research report and risk assessment are required for portfolio decisions")
+        
+        # Configure decision and order type based on test_mode
+        test_mode = state.get("test_mode")
+        
+        # Decision options
+        if test_mode and test_mode.decision:
+            # Check if single decision or multiple options
+            if "/" in test_mode.decision:
+                # Multiple options allowed
+                decision_options = f"[{test_mode.decision}]"
+                extra_instruction = f"\n6. You can only choose from {decision_options}."
+            else:
+                # Single forced decision
+                decision_options = f"[{test_mode.decision}]"
+                extra_instruction = f"\n6. ⚠️ You MUST choose {test_mode.decision}."
+        else:
+            decision_options = "[LONG/SHORT/EXIT/HOLD]"
+            extra_instruction = ""
+        
+        # Order type options
+        if test_mode and test_mode.order_type:
+            order_type_option = f"[{test_mode.order_type}]"
+            extra_instruction += f"\n7. ⚠️ Entry type MUST be {test_mode.order_type}."
+        else:
+            order_type_option = "[MARKET/LIMIT/LIMIT_BAND]"
+
+        system_decision_scope = decision_options.strip("[]")
+
+        # A forced HOLD on a flat account leaves nothing to decide or size,
+        # so skip the LLM round trip and emit the plan directly. With an open
+        # position the LLM is still needed to refresh Stop-Loss/Take-Profit.
+        forced_flat_hold = (
+            test_mode
+            and test_mode.decision
+            and test_mode.decision.strip().upper() == "HOLD"
+            and _NO_POSITION_RE.search(risk_assessment)
+        )
+        
+        if forced_flat_hold:
+            logger.info(f"🧪 Forced HOLD with no open position, skipping LLM for {symbol}")
+            result = AIMessage(content=_FORCED_HOLD_PLAN_TEMPLATE.format(symbol=symbol))
+        else:
+            context = {
+                "role": "user",
+                "content": _CONTEXT_TEMPLATE.format(
+                    technical_research_report=technical_research_report,
+                    risk_assessment=risk_assessment,
+                    extra_instruction=extra_instruction,
+                    decision_options=decision_options,
+                    order_type_option=order_type_option,
+                ),
+            }
+        
+            system_message = _SYSTEM_TEMPLATE.format(
+                symbol=symbol,
+                system_decision_scope=system_decision_scope,
+            )
         
-        chain = llm
-        result = chain.invoke([
-            {"role": "system", "content": system_message},
-            context
-        ])
+            chain = llm
+            result = chain.invoke([
+                {"role": "system", "content": system_message},
+                context
+            ])
         
         # Extract text report and summary
         full_content = result.content
         portfolio_plan = ""
         portfolio_plan_summary = ""
         
-        # Split the report and summary
-        # Look for "### 💭 Plain Language Summary" marker
-        if "### 💭 Plain Language Summary" in full_content or "Plain Language Summary" in full_content:
-            parts = full_content.split("### 💭 Plain Language Summary", 1)
-            portfolio_plan = parts[0].strip()
+        # Split the report and summary at the "### 💭 Plain Language Summary" marker
+        match = _SUMMARY_MARKER_RE.search(full_content)
+        if match:
+            portfolio_plan = full_content[:match.start()].strip()
             
             # Extract summary (everything after the marker until the next "---" or end)
-            if len(parts) > 1:
-                summary_section = parts[1].strip()
-                # Remove the ending "---" if present
-                summary_section = summary_section.split("---")[0].strip()
-                portfolio_plan_summary = summary_section
+            portfolio_plan_summary = full_content[match.end():].split("---", 1)[0].strip()
         else:
             # Fallback: use full content as report if no summary section found
             portfolio_plan = full_content
         
         logger.info(f"✅ Portfolio Plan generated for {symbol}")
-        logger.debug(f"Plan length: {len(portfolio_plan)} characters")
-        logger.debug(f"Summary length: {len(portfolio_plan_summary)} characters")
+        logger.opt(lazy=True).debug("Plan length: {} characters", lambda: len(portfolio_plan))
+        logger.opt(lazy=True).debug("Summary length: {} characters", lambda: len(portfolio_plan_summary))
         
         # Record execution to external API
         # Only record human-friendly summary (not the full portfolio plan)
@@ -197,9 +250,10 @@ Your decision synthesizes: market opportunity + account capacity → executable
         if portfolio_plan_summary:
             record_agent_execution(state, "portfolio_manager_summary", portfolio_plan_summary)
         
-        # Append to message history, don't replace it
+        # Return only the new message; the add_messages reducer on
+        # AgentState.messages appends it to the history
         return {
-            "messages": state["messages"] + [result],
+            "messages": [result],
             "portfolio_plan": portfolio_plan,
             "portfolio_plan_summary": portfolio_plan_summary,
             "sender": "portfolio_manager",
@@ -5,63 +5,30 @@ Evaluates account status, position risk, and entry feasibility.
 Outputs a clear, structured TEXT report for downstream agents.
 """
 
+import hashlib
+import json
+from functools import lru_cache
+from types import MappingProxyType
+
+from langchain_core.messages import ToolMessage
 from loguru import logger
 
 from tradingagents.agents.prompt_utils import build_collaboration_prompt
 from tradingagents.agents.utils.analysis_recorder import record_agent_execution
+from tradingagents.agents.utils.futures_execution_tools import (
+    get_comprehensive_trading_status,
+)
+from tradingagents.agents.utils.agent0_tools_a2a import invoke_research_agent
 
 
-def create_risk_manager(llm):
-    """
-    Build the futures risk manager node.
-    
-    Args:
-        llm: Language model instance
-        
-    Returns:
-        Risk manager node callable.
-    """
-    
-    def risk_manager_node(state):
-        symbol = state["trading_symbol"]
-
-        # Import futures tools
-        from tradingagents.agents.utils.futures_execution_tools import (
-            get_comprehensive_trading_status,
-        )
-        from tradingagents.agents.utils.agent0_tools_a2a import (
-            invoke_research_agent,
-            discover_research_agents,
-        )
-
-        tools = [
-            # Agent0 tools for research agent invocation
-            invoke_research_agent,
-            discover_research_agents,
-            # Trading status tool
-            get_comprehensive_trading_status,
-        ]
-        
-        # Get reflection context if this is a reanalysis cycle
-        reflection_context = ""
-        reflection_count = state.get("reflection_count", 0)
-        
-        if reflection_count > 0:
-            reflection_insights = state.get("reflection_insights", "")
-            reflection_issues = state.get("reflection_issues", "")
-            
-            reflection_context = "\n\n🔄 **REFLECTION CONTEXT** (This is a reanalysis cycle)\n"
-            if reflection_insights:
-                reflection_context += f"📚 Previous Insights:\n{reflection_insights}\n\n"
-            if reflection_issues:
-                reflection_context += f"⚠️  Issues to Address:\n{reflection_issues}\n\n"
-            reflection_context += "Please incorporate these learnings into your assessment.\n"
-        
-        # Get market timeframes from state
-        market_timeframes = state.get("market_timeframes", {"primary": "1h", "secondary": ["5m", "15m"]})
-        timeframes_json = str(market_timeframes).replace("'", '"')  # Convert to JSON-like string
+# Timeframes used when the state does not provide any, with their JSON form precomputed
+# (read-only: the same object is shared by every node call)
+_TIMEFRAMES_JSON_SEPARATORS = (",", ":")
+_DEFAULT_TIMEFRAMES = MappingProxyType({"primary": "1h", "secondary": ("5m", "15m")})
+_DEFAULT_TIMEFRAMES_JSON = json.dumps(dict(_DEFAULT_TIMEFRAMES), separators=_TIMEFRAMES_JSON_SEPARATORS)
 
-        system_message = f"""You are a Risk Manager AI. Your audience is another AI agent (the Portfolio Manager).
+# Static system prompt; only the placeholders change between invocations
+_SYSTEM_TEMPLATE = """You are a Risk Manager AI. Your audience is another AI agent (the Portfolio Manager).
 {reflection_context}
 **YOUR TASK:** Get market research, assess account/position status, then output a 'RISK ASSESSMENT' section.
 
@@ -73,13 +40,12 @@ def create_risk_manager(llm):
 5. **IMPORTANT**: If the result shows `"position_exists": false`, this is NORMAL and you MUST still generate a complete report for the "NO position" case.
 
 **EXECUTION WORKFLOW:**
-1. **FIRST**: Call `invoke_research_agent(symbol="{symbol}", timeframes='{timeframes_json}')` to get market analysis from a research agent
-   - This will automatically discover and invoke the best available research agent
-   - Review the research_report and research_summary in the response
+1. **FIRST (one turn, both tools)**: In a SINGLE response, emit BOTH tool calls together - they are independent:
+   - `invoke_research_agent(symbol="{symbol}", timeframes='{timeframes_json}')` to get market analysis from a research agent
+     (automatically discovers and invokes the best available research agent; review research_report and research_summary in the response)
+   - `get_comprehensive_trading_status("{symbol}")` to get complete trading state (account + position + orders in one call)
 
-2. **SECOND**: Call `get_comprehensive_trading_status("{symbol}")` to get complete trading state (account + position + orders in one call)
-
-3. **THIRD**: Generate your risk assessment based on BOTH the research report AND the account status
+2. **SECOND**: Generate your risk assessment based on BOTH the research report AND the account status
    - Consider market conditions from research report
    - Assess account health and position risk
    - ALWAYS generate a complete report even if there's no position
@@ -150,27 +116,100 @@ Guidelines:
 - Minimum position: $100 USD (below this, trading costs often exceed potential profits)
 - NEVER return an empty report - always generate the full section even if there's no position
 """
+
+
+@lru_cache(maxsize=128)
+def _build_system_message(symbol: str, timeframes_json: str, reflection_context: str) -> str:
+    """Render the system prompt; identical inputs on later cycles hit the cache."""
+    return _SYSTEM_TEMPLATE.format(
+        reflection_context=reflection_context,
+        symbol=symbol,
+        timeframes_json=timeframes_json,
+    )
+
+
+def create_risk_manager(llm):
+    """
+    Build the futures risk manager node.
+    
+    Args:
+        llm: Language model instance
         
-        prompt = build_collaboration_prompt()
+    Returns:
+        Risk manager node callable.
+    """
+    tools = [
+        # Agent0 research agent invocation (runs ERC-8004 discovery internally,
+        # so discover_research_agents is not bound - its schema would only
+        # cost prompt tokens on every call)
+        invoke_research_agent,
+        # Trading status tool
+        get_comprehensive_trading_status,
+    ]
+    
+    # Tool set, prompt scaffold and tool binding are fixed per graph: build them once
+    prompt_template = build_collaboration_prompt().partial(
+        tool_names=", ".join(tool.name for tool in tools)
+    )
+    bound_llm = llm.bind_tools(tools)
+    
+    def risk_manager_node(state):
+        # Snapshot everything this node reads from state once
+        symbol = state["trading_symbol"]
+        messages = state["messages"]
+        reflection_count = state.get("reflection_count") or 0
+        market_timeframes = state.get("market_timeframes")
+        uploaded_record_ids = state.get("uploaded_record_ids") or set()
         
-        prompt = prompt.partial(system_message=system_message)
-        prompt = prompt.partial(tool_names=", ".join([tool.name for tool in tools]))
+        # Get reflection context if this is a reanalysis cycle
+        # (insights/issues are only fetched when they will actually be used)
+        reflection_context = ""
+        if reflection_count > 0:
+            reflection_insights = state.get("reflection_insights", "")
+            reflection_issues = state.get("reflection_issues", "")
+            
+            reflection_context = "\n\n🔄 **REFLECTION CONTEXT** (This is a reanalysis cycle)\n"
+            if reflection_insights:
+                reflection_context += f"📚 Previous Insights:\n{reflection_insights}\n\n"
+            if reflection_issues:
+                reflection_context += f"⚠️  Issues to Address:\n{reflection_issues}\n\n"
+            reflection_context += "Please incorporate these learnings into your assessment.\n"
+        
+        # Serialize market timeframes for the prompt
+        if market_timeframes is None:
+            timeframes_json = _DEFAULT_TIMEFRAMES_JSON
+        else:
+            timeframes_json = json.dumps(market_timeframes, separators=_TIMEFRAMES_JSON_SEPARATORS)
+
+        system_message = _build_system_message(symbol, timeframes_json, reflection_context)
         
-        chain = prompt | llm.bind_tools(tools)
+        chain = prompt_template.partial(system_message=system_message) | bound_llm
         # Extract and upload research agent result immediately (before LLM processing)
         # This ensures we capture the A2A interaction record as soon as it's available
-        import json
         technical_research_report = ""
+        new_record_ids = set()
         research_error = None
         research_error_type = None
         
         # Check if we have a research agent response in the latest messages
-        for msg in reversed(state["messages"][-5:]):  # Check last 5 messages
-            if hasattr(msg, "content") and isinstance(msg.content, str):
+        for i in range(len(messages) - 1, max(-1, len(messages) - 6), -1):  # Check last 5 messages
+            msg = messages[i]
+            # Research payloads only ever arrive as tool results
+            if not isinstance(msg, ToolMessage):
+                continue
+            content = msg.content
+            # Cheap prefilter: only a JSON object mentioning research_report can be
+            # the research payload. startswith is O(1) and rejects AI text replies
+            # before the substring scan; everything else skips decoding entirely
+            if (
+                isinstance(content, str)
+                and content.startswith("{")
+                and '"research_report"' in content
+            ):
                 try:
-                    data = json.loads(msg.content)
+                    data = json.loads(content)
                     
-                    if "research_report" in data:
+                    if isinstance(data, dict) and "research_report" in data:
                         research_summary = data.get("research_summary", "")
                         research_json_value = data.get("jsonValue")
                         
@@ -178,9 +217,11 @@ Guidelines:
                         # CRITICAL: Check if we already recorded this to avoid duplicates
                         # The graph loop might cause this node to be visited multiple times
                         if research_json_value and research_summary:
-                            if state.get("technical_research_report"):
+                            record_key = "research_agent:" + hashlib.sha1(research_json_value.encode("utf-8")).hexdigest()
+                            if record_key in uploaded_record_ids:
                                 logger.info("ℹ️ Research report already recorded in state, skipping duplicate upload.")
                             else:
+                                new_record_ids.add(record_key)
                                 logger.info(f"✅ Found research agent response (summary: {len(research_summary)} chars, jsonValue: {len(research_json_value)} chars)")
                                 logger.info("📤 Uploading research agent execution record...")
                                 record_agent_execution(
@@ -202,7 +243,7 @@ Guidelines:
                 except (json.JSONDecodeError, TypeError):
                     continue
         
-        result = chain.invoke(state["messages"])
+        result = chain.invoke(messages)
         
         # Check if LLM wants to call tools
         # Only extract report when tool calling is complete
@@ -240,18 +281,16 @@ Guidelines:
 
             full_content = result.content
 
-            # Split the report and summary
-            # Look for "### 💭 Plain Language Summary" marker
-            if "### 💭 Plain Language Summary" in full_content or "Plain Language Summary" in full_content:
-                parts = full_content.split("### 💭 Plain Language Summary", 1)
-                risk_assessment = parts[0].strip()
+            # Split the report and summary at the "### 💭 Plain Language Summary" marker
+            head, sep, tail = full_content.partition("### 💭 Plain Language Summary")
 
+            if sep:
+                risk_assessment = head.strip()
                 # Extract summary (everything after the marker until the next "---" or end)
-                if len(parts) > 1:
-                    summary_section = parts[1].strip()
-                    # Remove the ending "---" if present
-                    summary_section = summary_section.split("---")[0].strip()
-                    risk_assessment_summary = summary_section
+                risk_assessment_summary = tail.partition("---")[0].strip()
+            elif "Plain Language Summary" in full_content:
+                # Heading without the expected marker: keep the whole report, no summary
+                risk_assessment = full_content.strip()
             else:
                 # Fallback: use full content as report if no summary section found
                 risk_assessment = full_content
@@ -268,12 +307,14 @@ Guidelines:
         else:
             logger.debug(f"Risk Manager requesting {len(result.tool_calls)} tool calls")
 
-        # Append to message history, don't replace it
+        # Return only the new message; the add_messages reducer on
+        # AgentState.messages appends it to the history
         return {
-            "messages": state["messages"] + [result],
+            "messages": [result],
             "risk_assessment": risk_assessment,
             "risk_assessment_summary": risk_assessment_summary,
             "technical_research_report": technical_research_report,
+            "uploaded_record_ids": new_record_ids,
         }
     
     return risk_manager_node
@@ -235,7 +235,7 @@ If any tool call fails:
         if has_tool_calls:
             logger.debug(f"Trader requesting tool calls for {symbol}")
             return {
-                "messages": state["messages"] + [result],
+                "messages": [result],
                 "sender": "trader",
             }
 
@@ -267,7 +267,7 @@ If any tool call fails:
         record_agent_execution(state, "trader_summary", trade_summary)
         
         return {
-            "messages": state["messages"] + [result],
+            "messages": [result],
             "trade_report_summary": trade_summary,
             "sender": "trader",
         }
@@ -14,8 +14,10 @@ Uses simple JSON-RPC 2.0 over HTTP for A2A communication, which is:
 Reference implementation: research_agent_invoker_flow.py
 """
 
+import base64
 import json
 import os
+import time
 from typing import Dict, Optional, Any, List
 from datetime import datetime, timedelta
 from langchain_core.tools import tool
@@ -29,6 +31,23 @@ from loguru import logger
 # Global SDK instance (will be initialized during startup)
 _agent0_sdk = None
 
+# Successful research results for the current trading round, keyed by
+# (symbol, timeframes, agent_id) -> (monotonic timestamp, JSON result).
+# Research is the most expensive tool call (network + remote LLM + x402 payment),
+# so a repeated request within the round reuses the first answer. The TTL keeps
+# entries from leaking into the next scheduled round.
+_RESEARCH_CACHE: Dict[tuple, tuple] = {}
+_RESEARCH_CACHE_TTL_SECONDS = 180
+
+# Research payloads are read by the LLM: keep unicode (emoji, CJK) as-is instead
+# of \uXXXX escapes and drop indentation whitespace to save context tokens
+_LLM_JSON_KWARGS = {"ensure_ascii": False, "separators": (",", ":")}
+
+
+def clear_research_cache():
+    """Drop cached research results (call at the start of each trading round)."""
+    _RESEARCH_CACHE.clear()
+
 
 def initialize_agent0_sdk(
     chain_id: int = 11155111,  # Sepolia testnet by default
@@ -220,6 +239,16 @@ def invoke_research_agent(
     Returns:
         JSON string with research results including research_report, research_summary, and confidence
     """
+    # Reuse a successful result from earlier in this trading round
+    cache_key = (symbol, timeframes, agent_id)
+    cached = _RESEARCH_CACHE.get(cache_key)
+    if cached is not None:
+        cached_at, cached_result = cached
+        if time.monotonic() - cached_at < _RESEARCH_CACHE_TTL_SECONDS:
+            logger.info(f"♻️  Reusing research result for {symbol} from this trading round")
+            return cached_result
+        del _RESEARCH_CACHE[cache_key]
+    
     # Track phases for jsonValue generation
     phases: List[Dict[str, str]] = []
     error_reason: Optional[str] = None
@@ -701,7 +730,13 @@ report: {report}
         # Add jsonValue to result
         result['jsonValue'] = json_value
 
-        return json.dumps(result, indent=2)
+        result_json = json.dumps(result, **_LLM_JSON_KWARGS)
+        
+        # Only cache complete payloads; errors are always retried
+        if report and summary:
+            _RESEARCH_CACHE[cache_key] = (time.monotonic(), result_json)
+
+        return result_json
 
     except Exception as e:
         error_str = str(e)
@@ -757,7 +792,7 @@ Description: {error_message}
             "research_summary": f"❌ Research agent error ({error_type}): {error_str}",
             "confidence": 0.0,
             "jsonValue": json_value
-        })
+        }, **_LLM_JSON_KWARGS)
 
 
 def _extract_response_data_from_jsonrpc(message_result: Dict[str, Any]) -> Dict[str, Any]:
@@ -957,9 +992,6 @@ def _decode_payment_response(payment_response_header: str) -> dict:
     Raises:
         ValueError: If header cannot be decoded
     """
-    import base64
-    import json
-    
     try:
         # Decode base64
         decoded_bytes = base64.b64decode(payment_response_header)
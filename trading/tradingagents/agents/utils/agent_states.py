@@ -1,10 +1,9 @@
-from typing import Annotated, Sequence
-from datetime import date, timedelta, datetime
+import operator
+from typing import Annotated, Dict, Any, Set
 from typing_extensions import TypedDict, Optional
-from langchain_openai import ChatOpenAI
-from tradingagents.agents import *
-from langgraph.prebuilt import ToolNode
-from langgraph.graph import END, StateGraph, START, MessagesState
+from langgraph.graph import MessagesState
+
+from tradingagents.config import TestMode
 
 
 # Researcher team state
@@ -63,6 +62,13 @@ class AgentState(MessagesState):
     record_id: Annotated[str, "UUID for this trading round (for external recording)"]
     trader_id: Annotated[str, "Trader UUID from config.yaml (e.g., '7bac06d6-3c9c-4af4-87b0-389820be0b37')"]
     order_id: Annotated[Optional[str], "Order ID when a trade is executed"]
+    uploaded_record_ids: Annotated[Set[str], operator.or_]  # Analysis records already uploaded this round (union-merged)
+
+    # ==================== RUN CONFIGURATION ====================
+    # Declared so LangGraph keeps them: keys missing from the schema are
+    # dropped from the graph input and never reach the nodes.
+    test_mode: Annotated[Optional[TestMode], "Forced decision/order type for testing (None in normal runs)"]
+    market_timeframes: Annotated[Dict[str, Any], "Primary/secondary kline intervals for research"]
 
     # ==================== AGENT REPORTS (Pure Text) ====================
     # Each agent outputs a focused, structured TEXT report (not JSON)
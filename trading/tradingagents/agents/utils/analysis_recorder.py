@@ -2,15 +2,34 @@
 Analysis recording utility for tracking agent executions.
 
 Records each agent's execution to an external API for monitoring and analytics.
-API calls are made synchronously to ensure reliable delivery of all records.
+Records are queued and posted by a single background thread so API latency
+never blocks the trading graph; call flush_analysis_records() at the end of a
+run to wait for pending deliveries.
 """
 
+import atexit
+import json
 import os
+import queue
+import threading
+import time
 import requests
 from datetime import datetime
 from loguru import logger
 
 
+# Pending records, drained in FIFO order by one background sender thread
+_RECORD_QUEUE_MAXSIZE = 1024
+_record_queue = queue.Queue(maxsize=_RECORD_QUEUE_MAXSIZE)
+_sender_thread = None
+_sender_lock = threading.Lock()
+
+# Upload body encoder (compact, UTF-8 as-is) and a keep-alive session; both are
+# only used from the sender thread
+_PAYLOAD_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_session = requests.Session()
+
+
 def _get_api_config():
     """Get API configuration from environment variables (set by config.yaml)."""
     return {
@@ -73,11 +92,12 @@ def send_analysis_record(
         # Send request
         url = f"{api_base_url}/analysis-records"
         headers = {
-            "Content-Type": "application/json",
+            "Content-Type": "application/json; charset=utf-8",
             "auth_admin": api_auth_header,
         }
+        body = _PAYLOAD_ENCODER.encode(payload).encode("utf-8")
         
-        response = requests.post(url, json=payload, headers=headers, timeout=5)
+        response = _session.post(url, data=body, headers=headers, timeout=5)
         response.raise_for_status()
         
         logger.debug(f"✅ Recorded {role} execution for {trader_id} (record: {record_id[:8]}...)")
@@ -90,6 +110,55 @@ def send_analysis_record(
         logger.error(f"❌ Unexpected error recording {role} execution: {e}")
 
 
+def _sender_loop():
+    """Background worker: post queued records one at a time."""
+    while True:
+        kwargs = _record_queue.get()
+        try:
+            send_analysis_record(**kwargs)
+        finally:
+            _record_queue.task_done()
+
+
+def _ensure_sender_thread():
+    """Start the sender thread on first use (and again after a fork)."""
+    global _sender_thread
+    if _sender_thread is not None and _sender_thread.is_alive():
+        return
+    with _sender_lock:
+        if _sender_thread is None or not _sender_thread.is_alive():
+            _sender_thread = threading.Thread(
+                target=_sender_loop,
+                name="analysis-recorder",
+                daemon=True,
+            )
+            _sender_thread.start()
+
+
+def flush_analysis_records(timeout: float = 15.0) -> bool:
+    """
+    Wait for queued records to be delivered.
+    
+    Args:
+        timeout: Maximum seconds to wait
+        
+    Returns:
+        True if the queue drained, False if records were still pending at timeout
+    """
+    deadline = time.monotonic() + timeout
+    with _record_queue.all_tasks_done:
+        while _record_queue.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(f"⚠️ {_record_queue.unfinished_tasks} analysis records still pending after {timeout}s")
+                return False
+            _record_queue.all_tasks_done.wait(remaining)
+    return True
+
+
+atexit.register(flush_analysis_records)
+
+
 def record_agent_execution(
     state: dict,
     agent_name: str,
@@ -97,11 +166,11 @@ def record_agent_execution(
     json_value: str = None,
 ) -> None:
     """
-    Record an agent's execution to the API synchronously.
+    Queue an agent's execution record for delivery to the API.
     
     This is a convenience wrapper that extracts necessary info from state
-    and calls send_analysis_record. The API call is blocking to ensure
-    reliable delivery of all records.
+    and hands it to the background sender, which calls send_analysis_record.
+    Returns immediately; records are dropped with a warning if the queue is full.
     
     Args:
         state: Current agent state
@@ -118,11 +187,15 @@ def record_agent_execution(
         logger.warning(f"⚠️ No record_id in state, skipping recording for {agent_name}")
         return
     
-    # Send the record synchronously
-    send_analysis_record(
-        trader_id=trader_id,
-        role=agent_name,
-        chat=report_content,
-        record_id=record_id,
-        json_value=json_value,
-    )
+    # Hand the record to the background sender
+    _ensure_sender_thread()
+    try:
+        _record_queue.put_nowait({
+            "trader_id": trader_id,
+            "role": agent_name,
+            "chat": report_content,
+            "record_id": record_id,
+            "json_value": json_value,
+        })
+    except queue.Full:
+        logger.warning(f"⚠️ Analysis record queue full, dropping {agent_name} record")
@@ -4,27 +4,158 @@ Utility functions for futures trade execution.
 Provides helper tools that agents can call during execution.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, Token
+from decimal import Decimal
 from langchain_core.tools import tool
-from typing import Optional, List, Dict
-import uuid
-import json
+from typing import Callable, Optional, List, Dict
+import itertools
 import math
+import os
+import random
+import time
 from loguru import logger
 from requests.exceptions import HTTPError
-from tradingagents.dataflows.asterdex_futures_api import AsterFuturesClient
+from tradingagents.dataflows.asterdex_futures_api import (
+    AsterFuturesClient,
+    CircuitOpenError,
+    get_shared_client,
+)
 from tradingagents.agents.utils.futures_models import (
     FuturesPosition,
     FuturesAccount,
     TradingPlan,
     calculate_position_size
 )
+from tradingagents.agents.utils.tool_output import to_json
 
 
 # Global client instance - will be set during initialization
 _client: Optional[AsterFuturesClient] = None
 
+# Shared worker threads for overlapping independent exchange requests within a tool.
+# Calls are blocking HTTP (GIL released while waiting), so threads give the same
+# RTT overlap as an event loop without making the LangGraph tools async.
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="aster-io")
+
+# Protective (reduce-only SL/TP) orders this process knows to be live, per symbol,
+# as {"orderId", "type"} entries. Only written from fresh snapshots or our own
+# placements within the current round; any other tool that touches orders drops
+# the entry so the next reader refetches.
+_protective_orders: Dict[str, List[Dict]] = {}
+
+# Last SL/TP state update_sl_tp_safe verified as optimal (or just placed), per symbol:
+# (monotonic time, stop_loss, take_profit, quantity). Dropped by every tool that
+# touches orders or the position, like _protective_orders; also expires after a TTL.
+_verified_sl_tp: Dict[str, tuple] = {}
+_VERIFIED_SL_TP_TTL = 10.0
+
+# Exchange error codes that will not succeed on retry: order rejected (e.g. margin
+# insufficient), stop price would trigger immediately, price outside percent band
+_NO_RETRY_ERROR_CODES = {-2010, -2021, -4131}
+_RATE_LIMIT_ERROR_CODE = -1003
+
+# Reduce-only order types that make up a position's SL/TP protection
+_PROTECTIVE_ORDER_TYPES = frozenset({"STOP_MARKET", "TAKE_PROFIT_MARKET"})
+
+# (current direction, planned action) pairs that reverse an open position
+_REVERSING_PAIRS = frozenset({("LONG", "SHORT"), ("SHORT", "LONG")})
 
-def initialize_futures_client(api_key: str, api_secret: str, base_url: str = "https://fapi.asterdex.com") -> None:
+# Client order id sequence, seeded with the start time so ids stay unique across restarts
+_order_counter = itertools.count(int(time.time()))
+
+# Positions/open-orders snapshots shared by the tools running inside one top-level
+# tool call (e.g. prepare_trading_environment -> update_sl_tp_safe), so a nested
+# tool reuses its caller's reads instead of refetching them. None outside a scope.
+_READ_CACHE: ContextVar[Optional[Dict]] = ContextVar("futures_read_cache", default=None)
+
+
+def _tool_error(error: Exception) -> str:
+    """
+    Log a failed tool call and return the error result.
+    
+    The warning is one line, attributed to the calling tool (depth=1); the
+    traceback is only logged at DEBUG level.
+    """
+    logger.opt(depth=1).warning("⚠️ Futures tool failed: {}", error)
+    logger.opt(exception=error, depth=1).debug("Futures tool traceback")
+    return to_json({"error": str(error)})
+
+
+def _next_client_order_id(prefix: str) -> str:
+    """
+    Unique client order id, e.g. "long_open_1f2a-6720c3e1".
+    
+    The pid keeps ids from forked pool workers (which inherit the same counter)
+    apart; the result stays well under the exchange's 36-character limit.
+    """
+    return f"{prefix}_{os.getpid():x}-{next(_order_counter):x}"
+
+
+def _fetch_concurrently(*calls: Callable) -> list:
+    """
+    Run independent zero-argument exchange calls in parallel.
+    
+    Like asyncio.gather(..., return_exceptions=True): results come back in call
+    order, and a call that raised yields its exception instead of a result.
+    """
+    futures = [_IO_EXECUTOR.submit(call) for call in calls]
+    results = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def _open_read_scope() -> Optional[Token]:
+    """
+    Start a read-cache scope for the current tool call.
+    
+    Returns None when already inside a caller's scope, so nested tools share it.
+    """
+    if _READ_CACHE.get() is not None:
+        return None
+    return _READ_CACHE.set({})
+
+
+def _close_read_scope(token: Optional[Token]) -> None:
+    """End a scope opened by _open_read_scope (no-op for a nested call)."""
+    if token is not None:
+        _READ_CACHE.reset(token)
+
+
+def _cached_read(key: tuple, fetch: Callable):
+    """Return fetch() once per read scope for key; plain fetch() outside a scope."""
+    cache = _READ_CACHE.get()
+    if cache is None:
+        return fetch()
+    if key not in cache:
+        cache[key] = fetch()
+    return cache[key]
+
+
+def _remember_read(key: tuple, value) -> None:
+    """Store a snapshot fetched elsewhere (e.g. on a worker thread) in the current scope."""
+    cache = _READ_CACHE.get()
+    if cache is not None:
+        cache[key] = value
+
+
+def _invalidate_reads() -> None:
+    """Drop cached snapshots after orders or positions have been changed."""
+    cache = _READ_CACHE.get()
+    if cache:
+        cache.clear()
+
+
+def initialize_futures_client(
+    api_key: str,
+    api_secret: str,
+    base_url: str = "https://fapi.asterdex.com",
+    prefetch_symbol: Optional[str] = None,
+) -> None:
     """
     Initialize the futures client with explicit configuration.
     
@@ -32,9 +163,34 @@ def initialize_futures_client(api_key: str, api_secret: str, base_url: str = "ht
         api_key: Exchange API key
         api_secret: Exchange API secret
         base_url: Exchange API base URL
+        prefetch_symbol: Optional symbol whose static data is warmed in the background
     """
     global _client
-    _client = AsterFuturesClient(api_key=api_key, api_secret=api_secret, base_url=base_url)
+    # Pool workers re-initialize every round: the shared client (and its warm
+    # keep-alive connections) is reused while the credentials are unchanged
+    _client = get_shared_client(api_key=api_key, api_secret=api_secret, base_url=base_url)
+    
+    # Orders may have changed on the exchange since the last round
+    _protective_orders.clear()
+    _verified_sl_tp.clear()
+    
+    if prefetch_symbol:
+        _IO_EXECUTOR.submit(_warm_client_caches, _client, prefetch_symbol)
+
+
+def _warm_client_caches(client: AsterFuturesClient, symbol: str) -> None:
+    """
+    Prefetch data the entry path needs while the agents are still analysing.
+    
+    Warms the server clock offset (otherwise synced by the first signed request)
+    and the symbol filters (exchangeInfo), so opening a position does not pay
+    those round trips. Balances are never prefetched: sizing must see live data.
+    """
+    try:
+        client._get_timestamp()
+        client.get_symbol_filters(symbol)
+    except Exception as e:
+        logger.debug("Cache warm-up for {} failed (will fetch on demand): {}", symbol, e)
 
 
 def get_futures_client() -> AsterFuturesClient:
@@ -44,13 +200,14 @@ def get_futures_client() -> AsterFuturesClient:
     Raises:
         RuntimeError: If client hasn't been initialized
     """
-    global _client
-    if _client is None:
+    # Read-only access: a single global load, no `global` declaration needed
+    client = _client
+    if client is None:
         raise RuntimeError(
             "Futures client not initialized. "
             "Call initialize_futures_client() before using execution tools."
         )
-    return _client
+    return client
 
 
 @tool
@@ -66,7 +223,19 @@ def get_futures_account_info(symbol: str = None) -> str:
     """
     try:
         client = get_futures_client()
-        account_data = client.get_account()
+        
+        # Account and position are independent: fetch them in one round trip
+        if symbol:
+            account_data, positions = _fetch_concurrently(
+                client.get_account,
+                lambda: client.get_positions(symbol),
+            )
+            if isinstance(positions, Exception):
+                raise positions
+        else:
+            account_data = client.get_account()
+        if isinstance(account_data, Exception):
+            raise account_data
         
         result = {
             "account": {
@@ -80,7 +249,6 @@ def get_futures_account_info(symbol: str = None) -> str:
         
         # Include position details when a symbol is provided
         if symbol:
-            positions = client.get_positions(symbol)
             if positions:
                 pos = positions[0]
                 result["position"] = {
@@ -96,10 +264,10 @@ def get_futures_account_info(symbol: str = None) -> str:
             else:
                 result["position"] = {"message": f"No position for {symbol}"}
         
-        return json.dumps(result, indent=2)
+        return to_json(result)
         
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _tool_error(e)
 
 
 @tool
@@ -122,7 +290,7 @@ def get_futures_position(symbol: str) -> str:
         
         # Check if position exists with non-zero amount
         if not positions:
-            return json.dumps({
+            return to_json({
                 "symbol": symbol,
                 "position_exists": False,
                 "message": f"No position for {symbol}"
@@ -146,10 +314,25 @@ def get_futures_position(symbol: str) -> str:
             "isolated_margin": pos["isolated_margin"],
         }
         
-        return json.dumps(result, indent=2)
+        return to_json(result)
         
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _tool_error(e)
+
+
+def _format_order(order: Dict) -> Dict:
+    """Summarize a raw exchange order into the fields the agents read."""
+    return {
+        "order_id": order.get("orderId"),
+        "side": order.get("side"),  # BUY or SELL
+        "type": order.get("type"),  # LIMIT, MARKET, STOP, etc.
+        "price": float(order.get("price") or 0),
+        "quantity": float(order.get("origQty") or 0),
+        "filled_quantity": float(order.get("executedQty") or 0),
+        "status": order.get("status"),
+        "reduce_only": order.get("reduceOnly", False),
+        "position_side": order.get("positionSide", "BOTH"),
+    }
 
 
 @tool
@@ -170,27 +353,16 @@ def get_open_orders(symbol: str) -> str:
         open_orders = client.get_open_orders(symbol)
         
         if not open_orders:
-            return json.dumps({
+            return to_json({
                 "message": f"No open orders for {symbol}",
                 "open_orders": []
             })
         
         # Process and format open orders for easier understanding
-        formatted_orders = []
-        for order in open_orders:
-            formatted_orders.append({
-                "order_id": order.get("orderId"),
-                "symbol": order.get("symbol"),
-                "side": order.get("side"),  # BUY or SELL
-                "type": order.get("type"),  # LIMIT, MARKET, STOP, etc.
-                "price": float(order.get("price", 0)),
-                "quantity": float(order.get("origQty", 0)),
-                "filled_quantity": float(order.get("executedQty", 0)),
-                "status": order.get("status"),
-                "time": order.get("time"),
-                "reduce_only": order.get("reduceOnly", False),
-                "position_side": order.get("positionSide", "BOTH"),
-            })
+        formatted_orders = [
+            {**_format_order(order), "symbol": order.get("symbol"), "time": order.get("time")}
+            for order in open_orders
+        ]
         
         result = {
             "symbol": symbol,
@@ -199,10 +371,10 @@ def get_open_orders(symbol: str) -> str:
             "warning": "These orders occupy margin. Consider canceling before placing new orders to avoid double-positioning."
         }
         
-        return json.dumps(result, indent=2)
+        return to_json(result)
         
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _tool_error(e)
 
 
 @tool
@@ -226,8 +398,17 @@ def get_comprehensive_trading_status(symbol: str) -> str:
     try:
         client = get_futures_client()
         
-        # 1. Fetch account information
-        account_data = client.get_account()
+        # Account, position and open orders are independent: fetch all three in
+        # parallel (one RTT instead of three), then handle each section as before
+        account_data, positions, open_orders = _fetch_concurrently(
+            client.get_account,
+            lambda: client.get_positions(symbol),
+            lambda: client.get_open_orders(symbol),
+        )
+        
+        # 1. Account information
+        if isinstance(account_data, Exception):
+            raise account_data
         total_equity = account_data["total_wallet_balance"] + account_data["total_unrealized_profit"]
         available_balance = account_data["available_balance"]
         total_margin_balance = account_data["total_margin_balance"]
@@ -242,76 +423,62 @@ def get_comprehensive_trading_status(symbol: str) -> str:
         else:
             margin_status = "HEALTHY"
         
-        # 2. Fetch position information
+        # 2. Position information
+        # Failed reads come back from _fetch_concurrently as exception objects:
+        # report them as such instead of re-raising just to catch them again
         position_info = {"position_exists": False}
-        try:
-            positions = client.get_positions(symbol)
-            if positions and abs(float(positions[0].get("position_amt", 0))) > 0:
-                pos = positions[0]
-                position_amt = float(pos["position_amt"])
-                entry_price = float(pos["entry_price"])
-                mark_price = float(pos["mark_price"])
-                liquidation_price = float(pos["liquidation_price"])
-                
-                # Calculate distance to liquidation
-                distance_to_liq = 0
-                if liquidation_price > 0:
-                    if position_amt > 0:  # LONG
-                        distance_to_liq = ((mark_price - liquidation_price) / mark_price) * 100
-                    else:  # SHORT
-                        distance_to_liq = ((liquidation_price - mark_price) / mark_price) * 100
-                
-                # Assess risk level
-                if distance_to_liq < 5:
-                    risk_level = "CRITICAL"
-                elif distance_to_liq < 10:
-                    risk_level = "HIGH"
-                elif distance_to_liq < 20:
-                    risk_level = "MEDIUM"
-                else:
-                    risk_level = "LOW"
-                
-                position_info = {
-                    "position_exists": True,
-                    "side": "LONG" if position_amt > 0 else "SHORT",
-                    "position_amt": abs(position_amt),
-                    "entry_price": entry_price,
-                    "mark_price": mark_price,
-                    "unrealized_profit": float(pos["unrealized_profit"]),
-                    "liquidation_price": liquidation_price,
-                    "distance_to_liquidation_pct": round(distance_to_liq, 2),
-                    "leverage": int(pos["leverage"]),
-                    "margin_type": pos["margin_type"],
-                    "risk_level": risk_level,
-                }
-        except Exception:
-            position_info = {"position_exists": False, "message": f"No position for {symbol}"}
+        if isinstance(positions, Exception):
+            logger.warning(f"⚠️ Position read failed for {symbol}: {positions}")
+            position_info["error"] = f"Could not read position: {positions}"
+        elif positions and abs(float(positions[0].get("position_amt", 0))) > 0:
+            pos = positions[0]
+            position_amt = float(pos["position_amt"])
+            entry_price = float(pos["entry_price"])
+            mark_price = float(pos["mark_price"])
+            liquidation_price = float(pos["liquidation_price"])
+            
+            # Calculate distance to liquidation
+            distance_to_liq = 0
+            if liquidation_price > 0:
+                if position_amt > 0:  # LONG
+                    distance_to_liq = ((mark_price - liquidation_price) / mark_price) * 100
+                else:  # SHORT
+                    distance_to_liq = ((liquidation_price - mark_price) / mark_price) * 100
+            
+            # Assess risk level
+            if distance_to_liq < 5:
+                risk_level = "CRITICAL"
+            elif distance_to_liq < 10:
+                risk_level = "HIGH"
+            elif distance_to_liq < 20:
+                risk_level = "MEDIUM"
+            else:
+                risk_level = "LOW"
+            
+            position_info = {
+                "position_exists": True,
+                "side": "LONG" if position_amt > 0 else "SHORT",
+                "position_amt": abs(position_amt),
+                "entry_price": entry_price,
+                "mark_price": mark_price,
+                "unrealized_profit": float(pos["unrealized_profit"]),
+                "liquidation_price": liquidation_price,
+                "distance_to_liquidation_pct": round(distance_to_liq, 2),
+                "leverage": int(pos["leverage"]),
+                "margin_type": pos["margin_type"],
+                "risk_level": risk_level,
+            }
         
-        # 3. Fetch open orders
+        # 3. Open orders
         open_orders_info = {"open_orders_count": 0, "open_orders": []}
-        try:
-            open_orders = client.get_open_orders(symbol)
-            if open_orders:
-                formatted_orders = []
-                for order in open_orders:
-                    formatted_orders.append({
-                        "order_id": order.get("orderId"),
-                        "side": order.get("side"),
-                        "type": order.get("type"),
-                        "price": float(order.get("price", 0)),
-                        "quantity": float(order.get("origQty", 0)),
-                        "filled_quantity": float(order.get("executedQty", 0)),
-                        "status": order.get("status"),
-                        "reduce_only": order.get("reduceOnly", False),
-                        "position_side": order.get("positionSide", "BOTH"),
-                    })
-                
-                open_orders_info = {
-                    "open_orders_count": len(open_orders),
-                    "open_orders": formatted_orders,
-                }
-        except Exception:
-            open_orders_info = {"open_orders_count": 0, "open_orders": []}
+        if isinstance(open_orders, Exception):
+            logger.warning(f"⚠️ Open orders read failed for {symbol}: {open_orders}")
+            open_orders_info["error"] = f"Could not read open orders: {open_orders}"
+        elif open_orders:
+            open_orders_info = {
+                "open_orders_count": len(open_orders),
+                "open_orders": [_format_order(order) for order in open_orders],
+            }
         
         # 4. Consolidate results
         result = {
@@ -328,10 +495,10 @@ def get_comprehensive_trading_status(symbol: str) -> str:
             "timestamp": account_data.get("updateTime"),
         }
         
-        return json.dumps(result, indent=2)
+        return to_json(result)
         
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _tool_error(e)
 
 
 @tool
@@ -348,12 +515,12 @@ def set_futures_leverage(symbol: str, leverage: int) -> str:
     """
     try:
         if leverage < 1 or leverage > 125:
-            return json.dumps({"error": "Leverage must be between 1 and 125"})
+            return to_json({"error": "Leverage must be between 1 and 125"})
         
         client = get_futures_client()
         result = client.set_leverage(symbol, leverage)
         
-        return json.dumps({
+        return to_json({
             "success": True,
             "symbol": symbol,
             "leverage": leverage,
@@ -361,7 +528,7 @@ def set_futures_leverage(symbol: str, leverage: int) -> str:
         })
         
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _tool_error(e)
 
 
 @tool
@@ -378,12 +545,12 @@ def set_margin_mode(symbol: str, margin_type: str = "ISOLATED") -> str:
     """
     try:
         if margin_type not in ["ISOLATED", "CROSSED"]:
-            return json.dumps({"error": "margin_type must be 'ISOLATED' or 'CROSSED'"})
+            return to_json({"error": "margin_type must be 'ISOLATED' or 'CROSSED'"})
         
         client = get_futures_client()
         result = client.set_margin_type(symbol, margin_type)
         
-        return json.dumps({
+        return to_json({
             "success": True,
             "symbol": symbol,
             "margin_type": margin_type,
@@ -393,17 +560,12 @@ def set_margin_mode(symbol: str, margin_type: str = "ISOLATED") -> str:
     except HTTPError as http_err:
         # Aster/Binance returns -4168 when Multi-Assets mode blocks isolated margin
         response = getattr(http_err, "response", None)
-        error_payload: Dict = {}
-        if response is not None:
-            try:
-                error_payload = response.json()
-            except Exception:
-                error_payload = {}
+        error_payload = _http_error_payload(http_err)
         error_code = error_payload.get("code")
         error_msg = error_payload.get("msg") or str(http_err)
         
         if error_code == -4168:
-            return json.dumps({
+            return to_json({
                 "success": True,
                 "symbol": symbol,
                 "requested_margin_type": margin_type,
@@ -415,14 +577,65 @@ def set_margin_mode(symbol: str, margin_type: str = "ISOLATED") -> str:
                 )
             })
         
-        return json.dumps({
+        return to_json({
             "error": str(http_err),
             "details": error_msg,
             "status_code": response.status_code if response else None
         })
         
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _tool_error(e)
+
+
+def _executed_quantity(order: Dict) -> Optional[Decimal]:
+    """Filled quantity reported by an order response, or None if it reports no fill."""
+    if order.get("status") not in ("FILLED", "PARTIALLY_FILLED"):
+        return None
+    return Decimal(str(order.get("executedQty") or 0))
+
+
+def _quantity_after_fill(before_state: Dict, order: Dict, side: str) -> Optional[float]:
+    """
+    Derive the position size after an entry order from the order response.
+    
+    Returns None when the response does not report a fill (e.g. a resting LIMIT)
+    or the fill did not leave a position on the order's side; callers then read
+    the position from the exchange instead.
+    """
+    executed = _executed_quantity(order)
+    if executed is None:
+        return None
+    
+    # Decimal: a float result such as 0.19999999999999998 would lose a whole step
+    # when the SL/TP quantity is later rounded down to the step size
+    before = Decimal(str(before_state["quantity"]))
+    signed = before if before_state["direction"] == "LONG" else -before
+    signed += executed if side == "BUY" else -executed
+    if (signed > 0) != (side == "BUY") or abs(signed) <= Decimal("0.0001"):
+        return None
+    return float(abs(signed))
+
+
+def _ceil_to_step(quantity: float, step_size: float, step_size_units: Optional[int] = None) -> float:
+    """
+    Round quantity up to a whole multiple of step_size.
+    
+    Integer arithmetic (see AsterFuturesClient._snap_to_step): math.ceil(quantity / step_size)
+    overshoots by a full step when binary division lands just above an integer
+    (e.g. 0.07 / 0.01 == 7.000000000000001).
+    """
+    return AsterFuturesClient._snap_to_step(quantity, step_size, step_size_units, round_up=True)
+
+
+def _get_flat_state() -> Dict:
+    """Position state for a symbol with no open position."""
+    return {
+        "has_position": False,
+        "direction": None,
+        "quantity": 0,
+        "entry_price": 0,
+        "unrealized_profit": 0
+    }
 
 
 def _get_position_state(client: AsterFuturesClient, symbol: str) -> Dict:
@@ -434,13 +647,7 @@ def _get_position_state(client: AsterFuturesClient, symbol: str) -> Dict:
     """
     positions = client.get_positions(symbol)
     if not positions:
-        return {
-            "has_position": False,
-            "direction": None,
-            "quantity": 0,
-            "entry_price": 0,
-            "unrealized_profit": 0
-        }
+        return _get_flat_state()
     
     pos = positions[0]
     position_amt = pos["position_amt"]
@@ -451,10 +658,259 @@ def _get_position_state(client: AsterFuturesClient, symbol: str) -> Dict:
         "quantity": abs(position_amt),
         "entry_price": pos["entry_price"],
         "unrealized_profit": pos["unrealized_profit"],
-        "mark_price": pos["mark_price"]
+        "mark_price": pos["mark_price"],
+        "leverage": pos["leverage"]
     }
 
 
+def _wait_for_position(
+    client: AsterFuturesClient,
+    symbol: str,
+    condition: Callable[[Dict], bool],
+    timeout: float = 2.0,
+    interval: float = 0.2
+) -> Dict:
+    """
+    Poll the position until condition(state) holds or timeout expires.
+    
+    Returns as soon as the exchange reflects the change instead of sleeping a
+    fixed worst-case delay; on timeout the last observed state is returned so
+    callers keep their existing "not updated yet" handling.
+    """
+    deadline = time.monotonic() + timeout
+    state = _get_position_state(client, symbol)
+    while not condition(state) and time.monotonic() < deadline:
+        time.sleep(interval)
+        state = _get_position_state(client, symbol)
+    return state
+
+
+def _cancel_orders(client: AsterFuturesClient, symbol: str, orders: List[Dict]) -> int:
+    """
+    Cancel the given open orders in one batch request.
+    
+    Per-order rejections are logged and skipped; failure of the request itself
+    propagates to the caller.
+    
+    Returns:
+        Number of orders actually cancelled.
+    """
+    if not orders:
+        return 0
+    
+    cancelled = 0
+    order_ids = [order["orderId"] for order in orders]
+    for order_id, response in zip(order_ids, client.cancel_batch_orders(symbol, order_ids)):
+        if "orderId" in response:
+            cancelled += 1
+        else:
+            logger.warning(f"Failed to cancel order {order_id}: {response.get('msg')}")
+    return cancelled
+
+
+def _cancel_all_known(
+    client: AsterFuturesClient,
+    symbol: str,
+    open_orders: List[Dict],
+    snapshot_stale: bool = False
+) -> int:
+    """
+    Cancel every open order of a symbol with one cancel-all request.
+    
+    One round trip however many orders there are (batch cancels go out ten ids
+    per request), and it also catches orders placed after the snapshot was taken.
+    Skipped entirely when the snapshot is empty and known to be current.
+    
+    Returns:
+        Number of orders in the snapshot (the endpoint does not report a count).
+    """
+    if open_orders or snapshot_stale:
+        client.cancel_all_orders(symbol)
+    _protective_orders[symbol] = []
+    return len(open_orders)
+
+
+def _forget_orders(symbol: str) -> None:
+    """Drop what this process knows about a symbol's orders before a tool changes them."""
+    _protective_orders.pop(symbol, None)
+    _verified_sl_tp.pop(symbol, None)
+
+
+def _take_protective_orders(client: AsterFuturesClient, symbol: str) -> List[Dict]:
+    """
+    Return the live protective orders for symbol and drop them from tracking.
+    
+    Uses the tracked orders when known, saving a get_open_orders round trip;
+    otherwise falls back to fetching open orders. Ids of orders that already
+    triggered just come back as per-order errors from the batch cancel.
+    """
+    tracked = _protective_orders.pop(symbol, None)
+    if tracked is not None:
+        return list(tracked)
+    return [
+        {"orderId": order["orderId"], "type": order.get("type")}
+        for order in client.get_open_orders(symbol)
+        if order.get("reduceOnly")
+    ]
+
+
+def _placed_sl_tp_orders(sl_tp_result: Dict) -> List[Dict]:
+    """The SL/TP orders accepted in a _place_sl_tp_with_retry result, as tracking entries."""
+    return [
+        {"orderId": sl_tp_result[leg]["orderId"], "type": order_type}
+        for leg, order_type in (("stop_loss", "STOP_MARKET"), ("take_profit", "TAKE_PROFIT_MARKET"))
+        if sl_tp_result.get(leg)
+    ]
+
+
+def _replace_protective_orders(
+    client: AsterFuturesClient,
+    symbol: str,
+    side: str,
+    old_orders: Optional[List[Dict]],
+    old_quantity: float,
+    total_quantity: float,
+    stop_loss_price: Optional[float],
+    take_profit_price: Optional[float],
+    adjustments: List[str]
+) -> Optional[Dict]:
+    """
+    Re-protect a position whose size changed: place the new SL/TP, then cancel the old set.
+    
+    Stop orders cannot be modified in place. Placing first means the position is
+    never left without a stop; old orders are then cancelled only for legs that
+    were placed (all of them once every requested leg is accepted). On failure
+    the remaining old orders stay active, sized for the old quantity.
+    
+    Args:
+        side: Close direction of the new orders ("SELL" for a long, "BUY" for a short)
+        old_orders: Protective orders to replace, or None if they could not be read
+        
+    Returns:
+        The _place_sl_tp_with_retry result, or None when no SL/TP was requested.
+    """
+    sl_tp_result = None
+    to_cancel = old_orders or []
+    kept = []
+    if stop_loss_price or take_profit_price:
+        adjustments.append(f"Placing SL/TP for total quantity: {total_quantity}")
+        sl_tp_result = _place_sl_tp_with_retry(
+            client=client,
+            symbol=symbol,
+            side=side,
+            quantity=total_quantity,  # Use TOTAL position quantity
+            stop_loss_price=stop_loss_price,
+            take_profit_price=take_profit_price,
+            max_retries=3
+        )
+        for error in sl_tp_result.get("errors", []):
+            adjustments.append(f"SL/TP retry: {error}")
+        
+        if sl_tp_result.get("final_error"):
+            placed_types = {order["type"] for order in _placed_sl_tp_orders(sl_tp_result)}
+            kept = [order for order in to_cancel if order.get("type") not in placed_types]
+            to_cancel = [order for order in to_cancel if order.get("type") in placed_types]
+            if kept:
+                adjustments.append(
+                    f"Warning: SL/TP placement failed, kept {len(kept)} old protective orders sized for "
+                    f"{old_quantity:.4f} while the position is now {total_quantity:.4f}"
+                )
+    
+    try:
+        cancelled_count = _cancel_orders(client, symbol, to_cancel)
+        adjustments.append(
+            f"Cancelled {cancelled_count} old protective orders "
+            f"(position changed: {old_quantity:.4f} -> {total_quantity:.4f})"
+        )
+        cancel_failed = False
+    except Exception as e:
+        adjustments.append(f"Warning: Could not cancel old orders: {str(e)}")
+        cancel_failed = True
+    
+    if old_orders is None or cancel_failed:
+        # The live order set is unknown: let the next reader refetch it
+        _protective_orders.pop(symbol, None)
+    else:
+        placed = _placed_sl_tp_orders(sl_tp_result) if sl_tp_result else []
+        _protective_orders[symbol] = placed + kept
+    return sl_tp_result
+
+
+def _place_entry_order(
+    client: AsterFuturesClient,
+    symbol: str,
+    side: str,
+    order_type: str,
+    quantity: float,
+    entry_price: Optional[float],
+    client_order_id: str,
+    flip_quantity: float,
+    adjustments: List[str]
+) -> Dict:
+    """
+    Submit the entry order, reversing an opposite position in the same order if needed.
+    
+    With flip_quantity > 0 (MARKET entries only) the order is sized to close the
+    opposite position and open the new one at once on the one-way (BOTH) position.
+    The old side's orders are cancelled only once that order is accepted, so a
+    rejected reversal leaves the old position with its SL/TP intact.
+    """
+    if not flip_quantity:
+        return client.place_order(
+            symbol=symbol,
+            side=side,
+            order_type=order_type,
+            quantity=quantity,
+            price=entry_price,
+            client_order_id=client_order_id,
+        )
+    
+    # Sum in Decimal: the order quantity is rounded down to the step size
+    order_quantity = float(Decimal(str(quantity)) + Decimal(str(flip_quantity)))
+    order = client.place_order(
+        symbol=symbol,
+        side=side,
+        order_type=order_type,
+        quantity=order_quantity,
+        client_order_id=client_order_id,
+    )
+    
+    try:
+        client.cancel_all_orders(symbol)
+        _protective_orders[symbol] = []
+        adjustments.append("Cancelled all orders of the reversed position")
+    except Exception as e:
+        adjustments.append(f"Note: Could not cancel orders of the reversed position: {str(e)}")
+    adjustments.append(f"Reversed position with a single {side} order of {order_quantity}")
+    return order
+
+
+def _http_error_payload(http_err: HTTPError) -> Dict:
+    """Return the exchange's JSON error body ({"code", "msg"}) of an HTTPError, if any."""
+    response = getattr(http_err, "response", None)
+    if response is None:
+        return {}
+    try:
+        return response.json()
+    except Exception:
+        return {}
+
+
+def _retry_delay(attempt: int, rate_limited: bool = False, retry_after: Optional[str] = None) -> float:
+    """
+    Seconds to wait before retry attempt + 1.
+    
+    Rate limits honour Retry-After (default 5s); anything else backs off
+    exponentially from 0.25s, capped at 4s, with ±50% jitter.
+    """
+    if rate_limited:
+        try:
+            return float(retry_after) if retry_after else 5.0
+        except ValueError:
+            return 5.0
+    return min(0.25 * (2 ** attempt), 4.0) * (0.5 + random.random())
+
+
 def _place_sl_tp_with_retry(
     client: AsterFuturesClient,
     symbol: str,
@@ -467,32 +923,55 @@ def _place_sl_tp_with_retry(
     """
     Place SL/TP orders with retry logic.
     
+    Transient failures are retried with exponential backoff; rejections the
+    exchange will repeat (see _NO_RETRY_ERROR_CODES) stop immediately.
+    
     Returns:
         Result dictionary with order IDs or error info.
     """
     result = {"stop_loss": None, "take_profit": None, "errors": []}
     
     for attempt in range(max_retries):
+        retry_after = None
         try:
+            # Only resubmit legs that have not been accepted yet
             sl_tp_result = client.place_sl_tp_orders(
                 symbol=symbol,
                 side=side,
                 quantity=quantity,
-                stop_loss_price=stop_loss_price,
-                take_profit_price=take_profit_price,
-                trigger_type="MARK_PRICE"
+                stop_loss_price=None if result["stop_loss"] else stop_loss_price,
+                take_profit_price=None if result["take_profit"] else take_profit_price,
+                trigger_type="MARK_PRICE",
+                raise_on_error=False
             )
-            result["stop_loss"] = sl_tp_result.get("stop_loss")
-            result["take_profit"] = sl_tp_result.get("take_profit")
-            return result
+            result["stop_loss"] = result["stop_loss"] or sl_tp_result.get("stop_loss")
+            result["take_profit"] = result["take_profit"] or sl_tp_result.get("take_profit")
+            if not sl_tp_result.get("errors"):
+                return result
+            error_codes = {error.get("code") for error in sl_tp_result["errors"].values()}
+            error_msg = f"Attempt {attempt + 1}/{max_retries} failed: Rejected legs: {sl_tp_result['errors']}"
+        except HTTPError as e:
+            error_codes = {_http_error_payload(e).get("code")}
+            if e.response is not None:
+                retry_after = e.response.headers.get("Retry-After")
+            error_msg = f"Attempt {attempt + 1}/{max_retries} failed: {str(e)}"
+        except CircuitOpenError as e:
+            # Exchange is failing fast; sleeping through backoff here would only stall the tool
+            result["errors"].append(f"Attempt {attempt + 1}/{max_retries} failed: {str(e)}")
+            result["final_error"] = str(e)
+            break
         except Exception as e:
+            error_codes = set()
             error_msg = f"Attempt {attempt + 1}/{max_retries} failed: {str(e)}"
-            result["errors"].append(error_msg)
-            if attempt < max_retries - 1:
-                import time
-                time.sleep(1)  # Wait before retry
-            else:
-                result["final_error"] = f"Failed after {max_retries} attempts"
+        
+        result["errors"].append(error_msg)
+        if error_codes & _NO_RETRY_ERROR_CODES:
+            result["final_error"] = f"Rejected by exchange (not retried): {sorted(error_codes & _NO_RETRY_ERROR_CODES)}"
+            break
+        if attempt < max_retries - 1:
+            time.sleep(_retry_delay(attempt, _RATE_LIMIT_ERROR_CODE in error_codes, retry_after))
+        else:
+            result["final_error"] = f"Failed after {max_retries} attempts"
     
     return result
 
@@ -511,7 +990,7 @@ def open_long_position(
     
     Supports:
     - Adding to existing long positions
-    - Switching from short to long (auto-closes short first)
+    - Switching from short to long (market: one reversing order; limit: closes short first)
     - Automatic SL/TP order management with retry
     
     Args:
@@ -527,49 +1006,70 @@ def open_long_position(
     """
     try:
         client = get_futures_client()
+        _verified_sl_tp.pop(symbol, None)
         adjustments = []
         
-        # 1. Check current position state
-        current_state = _get_position_state(client, symbol)
+        # 1. Check current position state; the sizing inputs (mark price, symbol
+        # filters) and the open orders are independent of it, so fetch them in the
+        # same round trip. The account is read later: cancelling orders below releases margin
+        current_state, mark_data, filters, open_orders = _fetch_concurrently(
+            lambda: _get_position_state(client, symbol),
+            lambda: None if entry_price else client.get_mark_price(symbol),
+            lambda: client.get_symbol_filters(symbol),
+            lambda: client.get_open_orders(symbol),
+        )
+        for fetched in (current_state, mark_data, filters):
+            if isinstance(fetched, Exception):
+                raise fetched
         
         # 2. Handle opposite position (SHORT → LONG)
-        if current_state["has_position"] and current_state["direction"] == "SHORT":
+        # A MARKET entry reverses it in one order (see _place_entry_order); a LIMIT
+        # entry may rest, so the opposite position is closed first
+        is_reversing = current_state["has_position"] and current_state["direction"] == "SHORT"
+        flip_quantity = current_state["quantity"] if is_reversing and not entry_price else 0.0
+        if flip_quantity:
+            adjustments.append(f"Detected SHORT position, reversing it with the LONG entry order")
+        elif is_reversing:
             adjustments.append(f"Detected SHORT position, closing it before opening LONG")
             close_result = client.close_position(symbol, percent=100.0)
             adjustments.append(f"Closed SHORT position: {close_result.get('message', 'Success')}")
             
-            # Wait briefly for position to close
-            import time
-            time.sleep(1)
+            # Wait for position to close (returns as soon as it is flat)
+            updated_state = _wait_for_position(
+                client, symbol, lambda state: not state["has_position"]
+            )
             
             # Verify position is closed
-            updated_state = _get_position_state(client, symbol)
             if updated_state["has_position"]:
-                return json.dumps({
+                return to_json({
                     "error": "Failed to close opposite SHORT position",
                     "current_position": updated_state
                 })
             
             # Safe to cancel all orders now (no position to protect)
             client.cancel_all_orders(symbol)
+            _protective_orders[symbol] = []
             adjustments.append("Cancelled all orders after closing opposite position")
         
-        # 3. If no position exists, clean up any stale orders
+        # 3. If no position exists, clean up any stale orders (skipped when the
+        # snapshot shows none; if it could not be read, cancel anyway)
         elif not current_state["has_position"]:
-            try:
-                client.cancel_all_orders(symbol)
-                adjustments.append("Cancelled stale orders (no position to protect)")
-            except Exception as e:
-                adjustments.append(f"Note: Could not cancel orders: {str(e)}")
+            if open_orders == []:
+                _protective_orders[symbol] = []
+            else:
+                try:
+                    client.cancel_all_orders(symbol)
+                    _protective_orders[symbol] = []
+                    adjustments.append("Cancelled stale orders (no position to protect)")
+                except Exception as e:
+                    adjustments.append(f"Note: Could not cancel orders: {str(e)}")
         
-        # 4. Fetch current price (used for quantity calculation)
-        mark_data = client.get_mark_price(symbol)
+        # 4. Current price (used for quantity calculation)
         current_price = entry_price if entry_price else mark_data["mark_price"]
         
         if current_price <= 0:
-            return json.dumps({"error": "Invalid current price returned by exchange"})
+            return to_json({"error": "Invalid current price returned by exchange"})
         
-        filters = client.get_symbol_filters(symbol)
         min_qty = filters.get("min_qty", 0.0)
         step_size = filters.get("step_size", 0.0)
         min_notional = filters.get("min_notional", 0.0)
@@ -587,10 +1087,10 @@ def open_long_position(
         quantity = target_qty
         
         if step_size and step_size > 0:
-            quantity = math.ceil(quantity / step_size) * step_size
+            quantity = _ceil_to_step(quantity, step_size, filters.get("step_size_units"))
         
         if quantity <= 0:
-            return json.dumps({"error": "Unable to determine a valid trade quantity"})
+            return to_json({"error": "Unable to determine a valid trade quantity"})
         
         # Update notional size after adjustments
         adjusted_notional = quantity * current_price
@@ -598,15 +1098,18 @@ def open_long_position(
         # 3. Check leverage and available balance constraints
         account_info = client.get_account()
         available_balance = account_info.get("available_balance", 0.0)
+        if flip_quantity:
+            # Margin held by the position being reversed is released by the same order
+            available_balance += flip_quantity * current_price / max(current_state["leverage"], 1)
         
         if available_balance <= 0:
-            return json.dumps({"error": "Insufficient available balance"})
+            return to_json({"error": "Insufficient available balance"})
         
         required_margin = adjusted_notional / max(leverage, 1)
         if required_margin > available_balance:
             min_leverage = math.ceil(adjusted_notional / available_balance)
             if min_leverage > 125:
-                return json.dumps({
+                return to_json({
                     "error": "Insufficient balance for minimum order size even at max leverage",
                     "required_notional": adjusted_notional,
                     "available_balance": available_balance,
@@ -620,32 +1123,38 @@ def open_long_position(
         client.set_leverage(symbol, leverage)
         
         # 6. Validate and adjust parameters
-        validation = client.validate_order_params(symbol, current_price, quantity)
+        validation = client.validate_order_params(symbol, current_price, quantity, filters=filters)
         if not validation["valid"]:
-            return json.dumps({"error": "Order validation failed", "details": validation["errors"]})
+            return to_json({"error": "Order validation failed", "details": validation["errors"]})
         
         quantity = validation["adjusted_quantity"]
         adjusted_notional = quantity * validation["adjusted_price"]
         
         # 7. Submit entry order
         order_type = "LIMIT" if entry_price else "MARKET"
-        client_order_id = f"long_open_{uuid.uuid4().hex[:8]}"
+        client_order_id = _next_client_order_id("long_open")
         
-        order = client.place_order(
-            symbol=symbol,
-            side="BUY",
-            order_type=order_type,
-            quantity=quantity,
-            price=entry_price,
-            client_order_id=client_order_id,
+        order = _place_entry_order(
+            client, symbol, "BUY", order_type, quantity, entry_price,
+            client_order_id, flip_quantity, adjustments
         )
         
         # 8. Get updated position (might include previous position + new order)
-        import time
-        time.sleep(0.5)  # Brief wait for order to be processed
-        final_state = _get_position_state(client, symbol)
-        total_quantity = final_state["quantity"]
-        old_quantity = current_state.get("quantity", 0)
+        # MARKET fills land almost immediately; a resting LIMIT may not fill at all,
+        # so it only gets the short window the old fixed wait used to give it
+        old_quantity = 0.0 if is_reversing else current_state.get("quantity", 0)
+        # A filled order reports executedQty: apply it to the known position instead
+        # of reading it back (the close-first path has already flattened the position)
+        before_state = _get_flat_state() if is_reversing and not flip_quantity else current_state
+        total_quantity = _quantity_after_fill(before_state, order, "BUY")
+        if total_quantity is None:
+            final_state = _wait_for_position(
+                client,
+                symbol,
+                lambda state: state["direction"] == "LONG" and abs(state["quantity"] - old_quantity) > 0.0001,
+                timeout=2.0 if order_type == "MARKET" else 0.5,
+            )
+            total_quantity = final_state["quantity"]
         
         if total_quantity <= 0:
             # Fallback if position not updated yet
@@ -660,35 +1169,17 @@ def open_long_position(
         if position_changed:
             # Position size changed (order filled), update SL/TP to match
             try:
-                open_orders = client.get_open_orders(symbol)
-                cancelled_count = 0
-                for order in open_orders:
-                    if order.get("reduceOnly"):  # Only cancel protective orders (SL/TP)
-                        try:
-                            client.cancel_order(symbol, order["orderId"])
-                            cancelled_count += 1
-                        except:
-                            pass
-                adjustments.append(f"Cancelled {cancelled_count} old protective orders (position changed: {old_quantity:.4f} -> {total_quantity:.4f})")
+                # Only replace protective orders (SL/TP)
+                old_protective_orders = _take_protective_orders(client, symbol)
             except Exception as e:
-                adjustments.append(f"Warning: Could not cancel old orders: {str(e)}")
-                
-            # 10. Place SL/TP for TOTAL position with retry logic
-            if stop_loss_price or take_profit_price:
-                adjustments.append(f"Placing SL/TP for total quantity: {total_quantity}")
-                sl_tp_result = _place_sl_tp_with_retry(
-                    client=client,
-                    symbol=symbol,
-                    side="SELL",  # Close long position
-                    quantity=total_quantity,  # Use TOTAL position quantity
-                    stop_loss_price=stop_loss_price,
-                    take_profit_price=take_profit_price,
-                    max_retries=3
-                )
+                old_protective_orders = None
+                adjustments.append(f"Warning: Could not read old protective orders: {str(e)}")
             
-                if sl_tp_result.get("errors"):
-                    for error in sl_tp_result["errors"]:
-                        adjustments.append(f"SL/TP retry: {error}")
+            # 10. Place SL/TP for TOTAL position with retry logic, then cancel the old set
+            sl_tp_result = _replace_protective_orders(
+                client, symbol, "SELL", old_protective_orders,  # Close long position
+                old_quantity, total_quantity, stop_loss_price, take_profit_price, adjustments
+            )
         else:
             # Position unchanged (limit order not filled yet), keep existing SL/TP
             adjustments.append(f"Position unchanged ({total_quantity:.4f}), existing SL/TP unchanged")
@@ -722,10 +1213,10 @@ def open_long_position(
         if adjustments:
             result["adjustments"] = adjustments
         
-        return json.dumps(result, indent=2)
+        return to_json(result)
         
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _tool_error(e)
 
 
 @tool
@@ -742,7 +1233,7 @@ def open_short_position(
     
     Supports:
     - Adding to existing short positions
-    - Switching from long to short (auto-closes long first)
+    - Switching from long to short (market: one reversing order; limit: closes long first)
     - Automatic SL/TP order management with retry
     
     Args:
@@ -758,55 +1249,75 @@ def open_short_position(
     """
     try:
         client = get_futures_client()
+        _verified_sl_tp.pop(symbol, None)
         adjustments = []
         
-        # 1. Check current position state
-        current_state = _get_position_state(client, symbol)
+        # 1. Check current position state; the sizing inputs (mark price, symbol
+        # filters) and the open orders are independent of it, so fetch them in the
+        # same round trip. The account is read later: cancelling orders below releases margin
+        current_state, mark_data, filters, open_orders = _fetch_concurrently(
+            lambda: _get_position_state(client, symbol),
+            lambda: None if entry_price else client.get_mark_price(symbol),
+            lambda: client.get_symbol_filters(symbol),
+            lambda: client.get_open_orders(symbol),
+        )
+        for fetched in (current_state, mark_data, filters):
+            if isinstance(fetched, Exception):
+                raise fetched
         
         # 2. Handle opposite position (LONG → SHORT)
-        if current_state["has_position"] and current_state["direction"] == "LONG":
+        # A MARKET entry reverses it in one order (see _place_entry_order); a LIMIT
+        # entry may rest, so the opposite position is closed first
+        is_reversing = current_state["has_position"] and current_state["direction"] == "LONG"
+        flip_quantity = current_state["quantity"] if is_reversing and not entry_price else 0.0
+        if flip_quantity:
+            adjustments.append(f"Detected LONG position, reversing it with the SHORT entry order")
+        elif is_reversing:
             adjustments.append(f"Detected LONG position, closing it before opening SHORT")
             close_result = client.close_position(symbol, percent=100.0)
             adjustments.append(f"Closed LONG position: {close_result.get('message', 'Success')}")
             
-            # Wait briefly for position to close
-            import time
-            time.sleep(1)
+            # Wait for position to close (returns as soon as it is flat)
+            updated_state = _wait_for_position(
+                client, symbol, lambda state: not state["has_position"]
+            )
             
             # Verify position is closed
-            updated_state = _get_position_state(client, symbol)
             if updated_state["has_position"]:
-                return json.dumps({
+                return to_json({
                     "error": "Failed to close opposite LONG position",
                     "current_position": updated_state
                 })
             
             # Safe to cancel all orders now (no position to protect)
             client.cancel_all_orders(symbol)
+            _protective_orders[symbol] = []
             adjustments.append("Cancelled all orders after closing opposite position")
         
-        # 3. If no position exists, clean up any stale orders
+        # 3. If no position exists, clean up any stale orders (skipped when the
+        # snapshot shows none; if it could not be read, cancel anyway)
         elif not current_state["has_position"]:
-            try:
-                client.cancel_all_orders(symbol)
-                adjustments.append("Cancelled stale orders (no position to protect)")
-            except Exception as e:
-                adjustments.append(f"Note: Could not cancel orders: {str(e)}")
+            if open_orders == []:
+                _protective_orders[symbol] = []
+            else:
+                try:
+                    client.cancel_all_orders(symbol)
+                    _protective_orders[symbol] = []
+                    adjustments.append("Cancelled stale orders (no position to protect)")
+                except Exception as e:
+                    adjustments.append(f"Note: Could not cancel orders: {str(e)}")
         
-        # 4. Fetch current price (used for quantity calculation)
-        mark_data = client.get_mark_price(symbol)
+        # 4. Current price (used for quantity calculation)
         current_price = entry_price if entry_price else mark_data["mark_price"]
         
         if current_price <= 0:
-            return json.dumps({"error": "Invalid current price returned by exchange"})
+            return to_json({"error": "Invalid current price returned by exchange"})
         
-        filters = client.get_symbol_filters(symbol)
         min_qty = filters.get("min_qty", 0.0)
         step_size = filters.get("step_size", 0.0)
         min_notional = filters.get("min_notional", 0.0)
         
         quantity = position_size_usd / current_price if position_size_usd > 0 else 0.0
-        adjustments = []
         
         min_qty_from_notional = (min_notional / current_price) if (min_notional and current_price > 0) else 0.0
         target_qty = max(quantity, min_qty, min_qty_from_notional)
@@ -818,24 +1329,27 @@ def open_short_position(
         quantity = target_qty
         
         if step_size and step_size > 0:
-            quantity = math.ceil(quantity / step_size) * step_size
+            quantity = _ceil_to_step(quantity, step_size, filters.get("step_size_units"))
         
         if quantity <= 0:
-            return json.dumps({"error": "Unable to determine a valid trade quantity"})
+            return to_json({"error": "Unable to determine a valid trade quantity"})
         
         adjusted_notional = quantity * current_price
         
         account_info = client.get_account()
         available_balance = account_info.get("available_balance", 0.0)
+        if flip_quantity:
+            # Margin held by the position being reversed is released by the same order
+            available_balance += flip_quantity * current_price / max(current_state["leverage"], 1)
         
         if available_balance <= 0:
-            return json.dumps({"error": "Insufficient available balance"})
+            return to_json({"error": "Insufficient available balance"})
         
         required_margin = adjusted_notional / max(leverage, 1)
         if required_margin > available_balance:
             min_leverage = math.ceil(adjusted_notional / available_balance)
             if min_leverage > 125:
-                return json.dumps({
+                return to_json({
                     "error": "Insufficient balance for minimum order size even at max leverage",
                     "required_notional": adjusted_notional,
                     "available_balance": available_balance,
@@ -849,32 +1363,38 @@ def open_short_position(
         client.set_leverage(symbol, leverage)
         
         # 6. Validate and adjust parameters
-        validation = client.validate_order_params(symbol, current_price, quantity)
+        validation = client.validate_order_params(symbol, current_price, quantity, filters=filters)
         if not validation["valid"]:
-            return json.dumps({"error": "Order validation failed", "details": validation["errors"]})
+            return to_json({"error": "Order validation failed", "details": validation["errors"]})
         
         quantity = validation["adjusted_quantity"]
         adjusted_notional = quantity * validation["adjusted_price"]
         
         # 7. Submit entry order
         order_type = "LIMIT" if entry_price else "MARKET"
-        client_order_id = f"short_open_{uuid.uuid4().hex[:8]}"
+        client_order_id = _next_client_order_id("short_open")
         
-        order = client.place_order(
-            symbol=symbol,
-            side="SELL",
-            order_type=order_type,
-            quantity=quantity,
-            price=entry_price,
-            client_order_id=client_order_id,
+        order = _place_entry_order(
+            client, symbol, "SELL", order_type, quantity, entry_price,
+            client_order_id, flip_quantity, adjustments
         )
         
         # 8. Get updated position (might include previous position + new order)
-        import time
-        time.sleep(0.5)  # Brief wait for order to be processed
-        final_state = _get_position_state(client, symbol)
-        total_quantity = final_state["quantity"]
-        old_quantity = current_state.get("quantity", 0)
+        # MARKET fills land almost immediately; a resting LIMIT may not fill at all,
+        # so it only gets the short window the old fixed wait used to give it
+        old_quantity = 0.0 if is_reversing else current_state.get("quantity", 0)
+        # A filled order reports executedQty: apply it to the known position instead
+        # of reading it back (the close-first path has already flattened the position)
+        before_state = _get_flat_state() if is_reversing and not flip_quantity else current_state
+        total_quantity = _quantity_after_fill(before_state, order, "SELL")
+        if total_quantity is None:
+            final_state = _wait_for_position(
+                client,
+                symbol,
+                lambda state: state["direction"] == "SHORT" and abs(state["quantity"] - old_quantity) > 0.0001,
+                timeout=2.0 if order_type == "MARKET" else 0.5,
+            )
+            total_quantity = final_state["quantity"]
         
         if total_quantity <= 0:
             # Fallback if position not updated yet
@@ -889,35 +1409,17 @@ def open_short_position(
         if position_changed:
             # Position size changed (order filled), update SL/TP to match
             try:
-                open_orders = client.get_open_orders(symbol)
-                cancelled_count = 0
-                for order in open_orders:
-                    if order.get("reduceOnly"):  # Only cancel protective orders (SL/TP)
-                        try:
-                            client.cancel_order(symbol, order["orderId"])
-                            cancelled_count += 1
-                        except:
-                            pass
-                adjustments.append(f"Cancelled {cancelled_count} old protective orders (position changed: {old_quantity:.4f} -> {total_quantity:.4f})")
+                # Only replace protective orders (SL/TP)
+                old_protective_orders = _take_protective_orders(client, symbol)
             except Exception as e:
-                adjustments.append(f"Warning: Could not cancel old orders: {str(e)}")
-                
-            # 10. Place SL/TP for TOTAL position with retry logic
-            if stop_loss_price or take_profit_price:
-                adjustments.append(f"Placing SL/TP for total quantity: {total_quantity}")
-                sl_tp_result = _place_sl_tp_with_retry(
-                    client=client,
-                    symbol=symbol,
-                    side="BUY",  # Close short position
-                    quantity=total_quantity,  # Use TOTAL position quantity
-                    stop_loss_price=stop_loss_price,
-                    take_profit_price=take_profit_price,
-                    max_retries=3
-                )
+                old_protective_orders = None
+                adjustments.append(f"Warning: Could not read old protective orders: {str(e)}")
             
-                if sl_tp_result.get("errors"):
-                    for error in sl_tp_result["errors"]:
-                        adjustments.append(f"SL/TP retry: {error}")
+            # 10. Place SL/TP for TOTAL position with retry logic, then cancel the old set
+            sl_tp_result = _replace_protective_orders(
+                client, symbol, "BUY", old_protective_orders,  # Close short position
+                old_quantity, total_quantity, stop_loss_price, take_profit_price, adjustments
+            )
         else:
             # Position unchanged (limit order not filled yet), keep existing SL/TP
             adjustments.append(f"Position unchanged ({total_quantity:.4f}), existing SL/TP unchanged")
@@ -951,10 +1453,10 @@ def open_short_position(
         if adjustments:
             result["adjustments"] = adjustments
         
-        return json.dumps(result, indent=2)
+        return to_json(result)
         
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _tool_error(e)
 
 
 @tool
@@ -975,26 +1477,22 @@ def close_position(symbol: str, percent: float = 100.0) -> str:
     """
     try:
         if percent <= 0 or percent > 100:
-            return json.dumps({"error": "Percent must be between 0 and 100"})
+            return to_json({"error": "Percent must be between 0 and 100"})
         
         client = get_futures_client()
+        _forget_orders(symbol)
         
         # Step 1: Cancel all reduce-only orders (SL/TP) before closing position
         # This prevents orphaned orders that would be useless after position is closed
         cancelled_orders = 0
         try:
             open_orders = client.get_open_orders(symbol)
-            for order in open_orders:
-                if order.get("reduceOnly"):
-                    try:
-                        client.cancel_order(symbol, order["orderId"])
-                        cancelled_orders += 1
-                        logger.debug(f"Cancelled protective order {order['orderId']} before closing position")
-                    except Exception as e:
-                        logger.warning(f"Failed to cancel order {order['orderId']}: {e}")
+            cancelled_orders = _cancel_orders(
+                client, symbol, [order for order in open_orders if order.get("reduceOnly")]
+            )
             
             if cancelled_orders > 0:
-                logger.info(f"Cancelled {cancelled_orders} protective orders before closing position")
+                logger.info("Cancelled {} protective orders before closing position", cancelled_orders)
         except Exception as e:
             logger.warning(f"Error while cancelling protective orders: {e}")
             # Continue to close position even if order cancellation fails
@@ -1002,17 +1500,17 @@ def close_position(symbol: str, percent: float = 100.0) -> str:
         # Step 2: Execute market order to close the position
         result = client.close_position(symbol, percent)
         
-        return json.dumps({
+        return to_json({
             "success": True,
             "action": "CLOSE_POSITION",
             "symbol": symbol,
             "percent": percent,
             "cancelled_orders": cancelled_orders,
             "result": result
-        }, indent=2)
+        })
         
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _tool_error(e)
 
 
 @tool
@@ -1036,11 +1534,12 @@ def update_sl_tp(
     """
     try:
         client = get_futures_client()
+        _forget_orders(symbol)
         
         # 1. Fetch current position
         positions = client.get_positions(symbol)
         if not positions:
-            return json.dumps({"error": f"No position for {symbol}"})
+            return to_json({"error": f"No position for {symbol}"})
         
         pos = positions[0]
         quantity = abs(pos["position_amt"])
@@ -1059,43 +1558,61 @@ def update_sl_tp(
             trigger_type="MARK_PRICE"
         )
         
-        return json.dumps({
+        return to_json({
             "success": True,
             "action": "UPDATE_SL_TP",
             "symbol": symbol,
             "stop_loss_price": stop_loss_price,
             "take_profit_price": take_profit_price,
             "orders": result
-        }, indent=2)
+        })
         
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _tool_error(e)
 
 
-def _extract_protective_orders(orders: List[Dict]) -> tuple:
+def _index_protective(orders: List[Dict]) -> Dict[str, Dict]:
     """
-    Extract existing stop-loss and take-profit prices from orders.
+    Index reduce-only protective orders by type in a single pass.
     
     Args:
         orders: List of open orders
         
     Returns:
-        Tuple of (stop_loss_price, take_profit_price)
+        {"STOP_MARKET": {"price": ..., "qty": ...}, "TAKE_PROFIT_MARKET": {...}};
+        a type is absent when there is no such order
     """
-    stop_loss_price = None
-    take_profit_price = None
-    
+    index = {}
     for order in orders:
         if not order.get("reduceOnly"):
             continue
-            
         order_type = order.get("type")
-        stop_price = float(order.get("stopPrice", 0))
+        if order_type in _PROTECTIVE_ORDER_TYPES:
+            index[order_type] = {
+                "price": float(order.get("stopPrice", 0)),
+                "qty": float(order.get("origQty", 0)),
+            }
+    return index
+
+
+def _extract_protective_orders(orders: List[Dict], index: Optional[Dict[str, Dict]] = None) -> tuple:
+    """
+    Extract existing stop-loss and take-profit prices from orders.
+    
+    Args:
+        orders: List of open orders
+        index: Result of _index_protective(orders), if the caller already built it
         
-        if order_type == "STOP_MARKET" and stop_price > 0:
-            stop_loss_price = stop_price
-        elif order_type == "TAKE_PROFIT_MARKET" and stop_price > 0:
-            take_profit_price = stop_price
+    Returns:
+        Tuple of (stop_loss_price, take_profit_price)
+    """
+    if index is None:
+        index = _index_protective(orders)
+    
+    stop_loss = index.get("STOP_MARKET")
+    take_profit = index.get("TAKE_PROFIT_MARKET")
+    stop_loss_price = stop_loss["price"] if stop_loss and stop_loss["price"] > 0 else None
+    take_profit_price = take_profit["price"] if take_profit and take_profit["price"] > 0 else None
     
     return stop_loss_price, take_profit_price
 
@@ -1185,7 +1702,7 @@ def _prices_match(
     existing_tp: Optional[float],
     new_sl: Optional[float],
     new_tp: Optional[float],
-    existing_orders: List[Dict] = None,
+    protective_index: Optional[Dict[str, Dict]] = None,
     expected_quantity: float = 0,
     threshold: float = 0.001  # 0.1%
 ) -> tuple:
@@ -1197,7 +1714,7 @@ def _prices_match(
         existing_tp: Current take-profit price
         new_sl: New stop-loss price
         new_tp: New take-profit price
-        existing_orders: List of existing orders to check quantities
+        protective_index: _index_protective() of the open orders, to check quantities
         expected_quantity: Expected quantity that SL/TP should protect
         threshold: Matching threshold (default 0.1%)
         
@@ -1209,40 +1726,34 @@ def _prices_match(
     qty_matches = True
     reasons = []
     
+    # |new - old| / old > threshold, squared to skip abs() and the division;
+    # the percentage is only computed for the reason message on a mismatch
+    threshold_sq = threshold * threshold
+    
     # Check stop-loss price
     if new_sl and existing_sl and existing_sl > 0:
-        sl_diff_pct = abs(new_sl - existing_sl) / existing_sl
-        if sl_diff_pct > threshold:
+        sl_diff = new_sl - existing_sl
+        if sl_diff * sl_diff > threshold_sq * existing_sl * existing_sl:
             sl_matches = False
-            reasons.append(f"SL price differs by {sl_diff_pct*100:.2f}% ({existing_sl} -> {new_sl})")
+            reasons.append(f"SL price differs by {abs(sl_diff) / existing_sl * 100:.2f}% ({existing_sl} -> {new_sl})")
     elif new_sl and not existing_sl:
         sl_matches = False
         reasons.append(f"SL missing, needs to be set to {new_sl}")
     
     # Check take-profit price
     if new_tp and existing_tp and existing_tp > 0:
-        tp_diff_pct = abs(new_tp - existing_tp) / existing_tp
-        if tp_diff_pct > threshold:
+        tp_diff = new_tp - existing_tp
+        if tp_diff * tp_diff > threshold_sq * existing_tp * existing_tp:
             tp_matches = False
-            reasons.append(f"TP price differs by {tp_diff_pct*100:.2f}% ({existing_tp} -> {new_tp})")
+            reasons.append(f"TP price differs by {abs(tp_diff) / existing_tp * 100:.2f}% ({existing_tp} -> {new_tp})")
     elif new_tp and not existing_tp:
         tp_matches = False
         reasons.append(f"TP missing, needs to be set to {new_tp}")
     
     # Check quantities match position size
-    if existing_orders and expected_quantity > 0:
-        existing_sl_qty = 0
-        existing_tp_qty = 0
-        
-        for order in existing_orders:
-            if order.get("reduceOnly"):
-                qty = float(order.get("origQty", 0))
-                order_type = order.get("type", "")
-                
-                if order_type == "STOP_MARKET":
-                    existing_sl_qty = qty
-                elif order_type == "TAKE_PROFIT_MARKET":
-                    existing_tp_qty = qty
+    if protective_index is not None and expected_quantity > 0:
+        existing_sl_qty = protective_index.get("STOP_MARKET", {}).get("qty", 0)
+        existing_tp_qty = protective_index.get("TAKE_PROFIT_MARKET", {}).get("qty", 0)
         
         # Check if SL quantity matches
         if existing_sl_qty > 0:
@@ -1268,70 +1779,79 @@ def _prices_match(
         return False, "; ".join(reasons)
 
 
-@tool
-def update_sl_tp_safe(
+def _update_sl_tp_safe(
     symbol: str,
     stop_loss_price: Optional[float] = None,
     take_profit_price: Optional[float] = None
-) -> str:
+) -> Dict:
     """
-    Safely update stop-loss and take-profit orders with built-in safety checks.
-    
-    This tool automatically handles:
-    - Danger zone detection: Won't update if price is too close to existing protective orders
-    - Price matching: Won't update if prices are already optimal (within 0.1% tolerance)
-    - Atomic updates: Creates new orders before cancelling old ones to prevent exposure
-    - Edge case handling: Manages missing orders, network failures, etc.
-    - Value preservation: If a parameter is None, the existing value is preserved
+    Core of update_sl_tp_safe, returning the result dict.
     
-    Safety thresholds:
-    - Stop-loss danger zone: 0.5% (won't update if price within 0.5% of SL)
-    - Take-profit danger zone: 0.2% (won't update if price within 0.2% of TP)
-    - Price matching tolerance: 0.1% (considers prices "same" if within 0.1%)
-    
-    Args:
-        symbol: Trading pair, e.g., "BTCUSDT"
-        stop_loss_price: New stop-loss price (None = keep existing SL unchanged)
-        take_profit_price: New take-profit price (None = keep existing TP unchanged)
-        
-    Returns:
-        JSON string with action taken ("updated", "skipped", or "error") and detailed reason
+    prepare_trading_environment calls this directly instead of decoding the
+    tool's JSON string; see update_sl_tp_safe for the behaviour.
     """
+    read_scope = _open_read_scope()
     try:
         client = get_futures_client()
         
-        # 1. Fetch current position
-        positions = client.get_positions(symbol)
+        # 1. Fetch current position (reuses the caller's snapshot when nested)
+        positions = _cached_read(("positions", symbol), lambda: client.get_positions(symbol))
         if not positions:
-            return json.dumps({
+            _forget_orders(symbol)
+            return {
                 "action": "error",
                 "reason": f"No position exists for {symbol}"
-            }, indent=2)
+            }
         
         pos = positions[0]
         position_amt = float(pos["position_amt"])
+        quantity = abs(position_amt)
         
-        if abs(position_amt) == 0:
-            return json.dumps({
+        if quantity == 0:
+            _forget_orders(symbol)
+            return {
                 "action": "error",
                 "reason": f"Position size is zero for {symbol}"
-            }, indent=2)
+            }
+        
+        # Fast path: this exact protection was verified (or placed) moments ago for
+        # a position of the same size. A fill or close the tools did not see (SL/TP
+        # triggered, manual trade) changes the size, so the record is not trusted then.
+        verified = _verified_sl_tp.get(symbol)
+        if verified and time.monotonic() - verified[0] < _VERIFIED_SL_TP_TTL:
+            verified_at, verified_sl, verified_tp, verified_qty = verified
+            if verified_qty == quantity and _prices_match(
+                verified_sl, verified_tp, stop_loss_price, take_profit_price
+            )[0]:
+                return {
+                    "action": "skipped",
+                    "reason": f"ALREADY OPTIMAL: verified {time.monotonic() - verified_at:.1f}s ago",
+                    "details": {
+                        "existing_stop_loss": verified_sl,
+                        "existing_take_profit": verified_tp,
+                        "position_quantity": verified_qty,
+                        "requested_stop_loss": stop_loss_price,
+                        "requested_take_profit": take_profit_price
+                    }
+                }
+        _forget_orders(symbol)
         
-        quantity = abs(position_amt)
         current_price = float(pos["mark_price"])
-        side = "SELL" if position_amt > 0 else "BUY"
-        position_side = "LONG" if position_amt > 0 else "SHORT"
+        is_long = position_amt > 0
+        side = "SELL" if is_long else "BUY"
+        position_side = "LONG" if is_long else "SHORT"
         
         # 2. Fetch existing orders
-        open_orders = client.get_open_orders(symbol)
-        existing_sl, existing_tp = _extract_protective_orders(open_orders)
+        open_orders = _cached_read(("open_orders", symbol), lambda: client.get_open_orders(symbol))
+        protective_index = _index_protective(open_orders)
+        existing_sl, existing_tp = _extract_protective_orders(open_orders, protective_index)
         
         # 3. SAFETY CHECK 1: Trailing stop validation (CRITICAL - prevents riding losses)
         is_valid_trailing, trailing_reason = _is_trailing_stop_valid(
             position_side, existing_sl, stop_loss_price, current_price
         )
         if not is_valid_trailing:
-            return json.dumps({
+            return {
                 "action": "rejected",
                 "reason": f"TRAILING STOP VIOLATION: {trailing_reason}",
                 "safety_note": "Stop-loss can ONLY move in a favorable direction (trailing stop). Moving it in an unfavorable direction would increase risk and is FORBIDDEN.",
@@ -1342,12 +1862,12 @@ def update_sl_tp_safe(
                     "requested_stop_loss": stop_loss_price,
                     "existing_take_profit": existing_tp
                 }
-            }, indent=2)
+            }
         
         # 4. SAFETY CHECK 2: Danger zone detection
         is_dangerous, danger_reason = _in_danger_zone(current_price, existing_sl, existing_tp)
         if is_dangerous:
-            return json.dumps({
+            return {
                 "action": "skipped",
                 "reason": f"DANGER ZONE: {danger_reason}",
                 "details": {
@@ -1358,16 +1878,18 @@ def update_sl_tp_safe(
                     "requested_take_profit": take_profit_price
                 },
                 "safety_note": "Not updating orders because price is too close to triggers. Let existing orders execute."
-            }, indent=2)
+            }
         
         # 5. SAFETY CHECK 3: Price and quantity matching
         prices_match, match_reason = _prices_match(
             existing_sl, existing_tp, stop_loss_price, take_profit_price,
-            existing_orders=open_orders,
+            # No open orders at all: nothing to compare quantities against
+            protective_index=protective_index if open_orders else None,
             expected_quantity=quantity
         )
         if prices_match:
-            return json.dumps({
+            _verified_sl_tp[symbol] = (time.monotonic(), existing_sl, existing_tp, quantity)
+            return {
                 "action": "skipped",
                 "reason": f"ALREADY OPTIMAL: {match_reason}",
                 "details": {
@@ -1377,14 +1899,16 @@ def update_sl_tp_safe(
                     "requested_stop_loss": stop_loss_price,
                     "requested_take_profit": take_profit_price
                 }
-            }, indent=2)
+            }
         
         # 6. ATOMIC UPDATE: Create new orders first, then cancel old ones
         # IMPORTANT: If None is passed, preserve existing value (don't remove it)
         final_sl = stop_loss_price if stop_loss_price is not None else existing_sl
         final_tp = take_profit_price if take_profit_price is not None else existing_tp
         
-        logger.info(f"Updating SL/TP for {symbol}: SL {existing_sl}->{final_sl}, TP {existing_tp}->{final_tp}")
+        logger.info(
+            "Updating SL/TP for {}: SL {}->{}, TP {}->{}", symbol, existing_sl, final_sl, existing_tp, final_tp
+        )
         
         # Step 6a: Create new protective orders
         try:
@@ -1398,7 +1922,7 @@ def update_sl_tp_safe(
             )
         except Exception as e:
             # If creating new orders fails, old orders remain intact (SAFE!)
-            return json.dumps({
+            return {
                 "action": "error",
                 "reason": f"Failed to create new orders: {str(e)}",
                 "safety_note": "Old protective orders remain intact - position is still protected",
@@ -1406,25 +1930,22 @@ def update_sl_tp_safe(
                     "existing_stop_loss": existing_sl,
                     "existing_take_profit": existing_tp
                 }
-            }, indent=2)
+            }
         
         # Step 6b: Only cancel old protective orders after new ones are successfully created
         # Important: Cancel ONLY old reduce-only orders, not the newly created ones
+        _invalidate_reads()
         cancelled_count = 0
         try:
-            for order in open_orders:
-                if order.get("reduceOnly"):
-                    try:
-                        client.cancel_order(symbol, order["orderId"])
-                        cancelled_count += 1
-                        logger.debug(f"Cancelled old protective order {order['orderId']}")
-                    except Exception as e:
-                        logger.warning(f"Failed to cancel old order {order['orderId']}: {e}")
-            logger.info(f"Cancelled {cancelled_count} old protective orders")
+            cancelled_count = _cancel_orders(
+                client, symbol, [order for order in open_orders if order.get("reduceOnly")]
+            )
+            logger.info("Cancelled {} old protective orders", cancelled_count)
+            _verified_sl_tp[symbol] = (time.monotonic(), final_sl, final_tp, quantity)
         except Exception as e:
             logger.warning(f"Error while cancelling old orders: {e}")
         
-        return json.dumps({
+        return {
             "action": "updated",
             "reason": match_reason,
             "details": {
@@ -1434,16 +1955,51 @@ def update_sl_tp_safe(
                 "old_take_profit": existing_tp,
                 "new_take_profit": final_tp,
                 "position_quantity": quantity,
-                "position_side": "LONG" if position_amt > 0 else "SHORT"
+                "position_side": position_side
             },
             "orders": new_orders
-        }, indent=2)
+        }
         
     except Exception as e:
-        return json.dumps({
+        logger.opt(exception=e).warning("⚠️ update_sl_tp_safe failed: {}", e)
+        return {
             "action": "error",
             "reason": f"Unexpected error: {str(e)}"
-        }, indent=2)
+        }
+    finally:
+        _close_read_scope(read_scope)
+
+
+@tool
+def update_sl_tp_safe(
+    symbol: str,
+    stop_loss_price: Optional[float] = None,
+    take_profit_price: Optional[float] = None
+) -> str:
+    """
+    Safely update stop-loss and take-profit orders with built-in safety checks.
+    
+    This tool automatically handles:
+    - Danger zone detection: Won't update if price is too close to existing protective orders
+    - Price matching: Won't update if prices are already optimal (within 0.1% tolerance)
+    - Atomic updates: Creates new orders before cancelling old ones to prevent exposure
+    - Edge case handling: Manages missing orders, network failures, etc.
+    - Value preservation: If a parameter is None, the existing value is preserved
+    
+    Safety thresholds:
+    - Stop-loss danger zone: 0.5% (won't update if price within 0.5% of SL)
+    - Take-profit danger zone: 0.2% (won't update if price within 0.2% of TP)
+    - Price matching tolerance: 0.1% (considers prices "same" if within 0.1%)
+    
+    Args:
+        symbol: Trading pair, e.g., "BTCUSDT"
+        stop_loss_price: New stop-loss price (None = keep existing SL unchanged)
+        take_profit_price: New take-profit price (None = keep existing TP unchanged)
+        
+    Returns:
+        JSON string with action taken ("updated", "skipped", or "error") and detailed reason
+    """
+    return to_json(_update_sl_tp_safe(symbol, stop_loss_price, take_profit_price))
 
 
 @tool
@@ -1466,18 +2022,20 @@ def reduce_position(symbol: str, reduce_pct: float) -> str:
     """
     try:
         if reduce_pct <= 0 or reduce_pct > 100:
-            return json.dumps({"error": "reduce_pct must be between 0 and 100"})
+            return to_json({"error": "reduce_pct must be between 0 and 100"})
         
         client = get_futures_client()
+        _forget_orders(symbol)
         
         # Fetch the current position
         positions = client.get_positions(symbol)
         if not positions:
-            return json.dumps({"error": f"No position for {symbol}"})
+            return to_json({"error": f"No position for {symbol}"})
         
         pos = positions[0]
         position_amt = pos["position_amt"]
-        reduce_qty = abs(position_amt) * (reduce_pct / 100.0)
+        old_qty = abs(position_amt)
+        reduce_qty = old_qty * (reduce_pct / 100.0)
         
         # Get existing SL/TP prices before reducing
         open_orders = client.get_open_orders(symbol)
@@ -1490,7 +2048,7 @@ def reduce_position(symbol: str, reduce_pct: float) -> str:
         # Note: Old SL/TP orders remain active during this process (by design)
         # This ensures the position is ALWAYS protected, even if subsequent steps fail
         # The exchange's reduceOnly mechanism prevents over-closing even if quantities don't match
-        client_order_id = f"reduce_{uuid.uuid4().hex[:8]}"
+        client_order_id = _next_client_order_id("reduce")
         order = client.place_order(
             symbol=symbol,
             side=side,
@@ -1500,29 +2058,25 @@ def reduce_position(symbol: str, reduce_pct: float) -> str:
             client_order_id=client_order_id
         )
         
-        # Wait briefly for order execution
-        time.sleep(0.5)
+        # New position size: from the fill in the order response when it has one,
+        # otherwise wait for the reduction to show up on the position
+        executed = _executed_quantity(order)
+        if executed is not None:
+            new_qty = float(Decimal(str(old_qty)) - executed)
+        else:
+            new_qty = _wait_for_position(
+                client,
+                symbol,
+                lambda state: state["quantity"] < old_qty - 0.0001,
+            )["quantity"]
         
         # Adjust SL/TP orders to match new position size (after successful reduction)
         sl_tp_update = None
         if existing_sl or existing_tp:
             try:
-                # Get new position size after reduction
-                new_positions = client.get_positions(symbol)
-                if new_positions and abs(float(new_positions[0]["position_amt"])) > 0:
-                    new_qty = abs(float(new_positions[0]["position_amt"]))
-                    
-                    # Cancel old SL/TP orders (now with incorrect quantities)
-                    cancelled_orders = 0
-                    for ord in open_orders:
-                        if ord.get("reduceOnly"):
-                            try:
-                                client.cancel_order(symbol, ord["orderId"])
-                                cancelled_orders += 1
-                            except Exception as e:
-                                logger.warning(f"Failed to cancel old order {ord['orderId']}: {e}")
-                    
-                    # Create new SL/TP with correct quantities
+                if new_qty > 0.0001:
+                    # Create new SL/TP with correct quantities first (one batch request),
+                    # so a failure here leaves the old orders in place
                     sl_tp_result = client.place_sl_tp_orders(
                         symbol=symbol,
                         side=side,
@@ -1531,21 +2085,29 @@ def reduce_position(symbol: str, reduce_pct: float) -> str:
                         take_profit_price=existing_tp,
                         trigger_type="MARK_PRICE"
                     )
+                    
+                    # Then cancel old SL/TP orders (now with incorrect quantities) in one batch
+                    cancelled_orders = _cancel_orders(
+                        client, symbol, [ord for ord in open_orders if ord.get("reduceOnly")]
+                    )
                     sl_tp_update = {
                         "adjusted": True,
                         "new_quantity": new_qty,
-                        "old_quantity": abs(position_amt),
+                        "old_quantity": old_qty,
                         "cancelled_orders": cancelled_orders,
                         "stop_loss": existing_sl,
                         "take_profit": existing_tp
                     }
-                    logger.info(f"Adjusted SL/TP after reducing position by {reduce_pct}% (qty: {abs(position_amt):.4f} -> {new_qty:.4f})")
+                    logger.info(
+                        "Adjusted SL/TP after reducing position by {}% (qty: {:.4f} -> {:.4f})",
+                        reduce_pct, old_qty, new_qty
+                    )
             except Exception as e:
                 sl_tp_update = {"adjusted": False, "error": str(e)}
                 logger.warning(f"Failed to adjust SL/TP after reduction: {e}")
-                logger.info(f"Old SL/TP orders remain active - position is still protected (reduceOnly prevents over-closing)")
+                logger.info("Old SL/TP orders remain active - position is still protected (reduceOnly prevents over-closing)")
         
-        return json.dumps({
+        return to_json({
             "success": True,
             "action": "REDUCE_POSITION",
             "symbol": symbol,
@@ -1554,10 +2116,10 @@ def reduce_position(symbol: str, reduce_pct: float) -> str:
             "order_id": order.get("orderId"),
             "client_order_id": client_order_id,
             "sl_tp_adjustment": sl_tp_update
-        }, indent=2)
+        })
         
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _tool_error(e)
 
 
 @tool
@@ -1576,18 +2138,19 @@ def cancel_order(symbol: str, order_id: int) -> str:
     """
     try:
         client = get_futures_client()
+        _forget_orders(symbol)
         result = client.cancel_order(symbol, order_id=order_id)
         
-        return json.dumps({
+        return to_json({
             "success": True,
             "action": "CANCEL_ORDER",
             "symbol": symbol,
             "order_id": order_id,
             "result": result
-        }, indent=2)
+        })
         
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _tool_error(e)
 
 
 @tool
@@ -1605,17 +2168,18 @@ def cancel_all_orders_for_symbol(symbol: str) -> str:
     """
     try:
         client = get_futures_client()
+        _forget_orders(symbol)
         result = client.cancel_all_orders(symbol)
         
-        return json.dumps({
+        return to_json({
             "success": True,
             "action": "CANCEL_ALL_ORDERS",
             "symbol": symbol,
             "result": result
-        }, indent=2)
+        })
         
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _tool_error(e)
 
 
 @tool
@@ -1652,17 +2216,33 @@ def prepare_trading_environment(
         - warnings: list of issues that need Agent attention
         - recommendation: suggested next step
     """
+    read_scope = _open_read_scope()
     try:
         client = get_futures_client()
+        # Judge protection from the fresh snapshot below, not a verification from earlier
+        _verified_sl_tp.pop(symbol, None)
         actions_taken = []
         warnings = []
         
         # ═══════════════════════════════════════
         # Step 1: Get current status
         # ═══════════════════════════════════════
-        logger.info(f"Preparing trading environment for {symbol}, action: {new_action}")
-        
-        positions = client.get_positions(symbol)
+        logger.info("Preparing trading environment for {}, action: {}", symbol, new_action)
+        
+        # The three reads are independent: fetch them in one concurrent round trip.
+        # The account is only needed for the equity when flat, but overlapping it
+        # here is free, while fetching it at the end cost a serial round trip
+        positions, open_orders, account_data = _fetch_concurrently(
+            lambda: client.get_positions(symbol),
+            lambda: client.get_open_orders(symbol),
+            lambda: client.get_account(),
+        )
+        for fetched in (positions, open_orders):
+            if isinstance(fetched, Exception):
+                raise fetched
+        # Share the snapshots with update_sl_tp_safe (Step 2) so it does not refetch them
+        _remember_read(("positions", symbol), positions)
+        _remember_read(("open_orders", symbol), open_orders)
         
         # Handle position status - empty list means no position (normal case)
         if positions and len(positions) > 0:
@@ -1676,42 +2256,32 @@ def prepare_trading_environment(
             position_amt = 0
             current_direction = None
         
-        # Get open orders
-        open_orders = client.get_open_orders(symbol)
-        
         # ═══════════════════════════════════════
         # Step 2: Check and fix SL/TP protection
         # ═══════════════════════════════════════
+        protection_rewritten = False
         if has_position and (stop_loss_price or take_profit_price):
             # Check current protection status
-            existing_sl, existing_tp = _extract_protective_orders(open_orders)
+            # One pass over the open orders; prices are judged by update_sl_tp_safe
+            protective_index = _index_protective(open_orders)
             quantity = abs(position_amt)
             
             # Check if protection needs update
-            sl_qty = 0
-            tp_qty = 0
-            for order in open_orders:
-                if order.get("reduceOnly"):
-                    qty = float(order.get("origQty", 0))
-                    if order["type"] == "STOP_MARKET":
-                        sl_qty = qty
-                    elif order["type"] == "TAKE_PROFIT_MARKET":
-                        tp_qty = qty
-            
-            # Check if quantities match (1% tolerance)
-            sl_match = abs(sl_qty - quantity) / quantity < 0.01 if quantity > 0 else False
-            tp_match = abs(tp_qty - quantity) / quantity < 0.01 if quantity > 0 else False
+            sl_qty = protective_index.get("STOP_MARKET", {}).get("qty", 0)
+            tp_qty = protective_index.get("TAKE_PROFIT_MARKET", {}).get("qty", 0)
             
-            protection_ok = sl_match and tp_match
+            # Check if quantities match (1% tolerance): the larger leg deviation decides,
+            # compared against the tolerance instead of dividing each by quantity
+            protection_ok = quantity > 0 and max(abs(sl_qty - quantity), abs(tp_qty - quantity)) < 0.01 * quantity
             
             if not protection_ok:
-                logger.info(f"Protection mismatch detected: position={quantity}, SL={sl_qty}, TP={tp_qty}")
+                logger.info("Protection mismatch detected: position={}, SL={}, TP={}", quantity, sl_qty, tp_qty)
                 
                 # Call update_sl_tp_safe to fix
                 try:
-                    # Import the result parsing (the tool returns JSON string)
-                    result_str = update_sl_tp_safe(symbol, stop_loss_price, take_profit_price)
-                    result = json.loads(result_str)
+                    # Dict-returning core: no JSON round trip through the tool wrapper
+                    protection_rewritten = True
+                    result = _update_sl_tp_safe(symbol, stop_loss_price, take_profit_price)
                     
                     if result.get("action") == "updated":
                         actions_taken.append(f"Fixed SL/TP protection: position {quantity}, updated protective orders")
@@ -1723,31 +2293,28 @@ def prepare_trading_environment(
                 except Exception as e:
                     warnings.append(f"Exception updating SL/TP: {str(e)}")
             else:
-                actions_taken.append("SL/TP protection verified: already optimal")
+                # Steady state (e.g. HOLD with an unchanged plan): when the prices also
+                # match, record it so a follow-up update_sl_tp_safe with the same plan
+                # returns from its fast path without touching the exchange
+                existing_sl, existing_tp = _extract_protective_orders(open_orders, protective_index)
+                if _prices_match(existing_sl, existing_tp, stop_loss_price, take_profit_price)[0]:
+                    _verified_sl_tp[symbol] = (time.monotonic(), existing_sl, existing_tp, quantity)
+                    actions_taken.append("SL/TP protection verified: prices and quantities already match the plan")
+                else:
+                    actions_taken.append("SL/TP protection verified: already optimal")
         
         # ═══════════════════════════════════════
         # Step 3: Clean up orders based on action
         # ═══════════════════════════════════════
         
         # Determine if reversing direction
-        is_reversing = (
-            has_position and
-            (
-                (current_direction == "LONG" and new_action == "SHORT") or
-                (current_direction == "SHORT" and new_action == "LONG")
-            )
-        )
+        is_reversing = has_position and (current_direction, new_action) in _REVERSING_PAIRS
         
         if is_reversing:
             # Scenario A: Reversing → need to cancel ALL orders (will close position first)
             try:
-                cancelled_count = 0
-                for order in open_orders:
-                    try:
-                        client.cancel_order(symbol, order["orderId"])
-                        cancelled_count += 1
-                    except:
-                        pass
+                _verified_sl_tp.pop(symbol, None)
+                cancelled_count = _cancel_all_known(client, symbol, open_orders, protection_rewritten)
                 actions_taken.append(f"Reversing direction: cancelled all {cancelled_count} orders")
             except Exception as e:
                 warnings.append(f"Failed to cancel orders during reversal: {str(e)}")
@@ -1755,19 +2322,17 @@ def prepare_trading_environment(
         elif has_position:
             # Scenario B: Has position (HOLD/MODIFY) → keep protective orders, cancel entry orders
             try:
-                cancelled_count = 0
-                kept_count = 0
-                for order in open_orders:
-                    if order.get("reduceOnly"):
-                        # Keep protective orders
-                        kept_count += 1
-                    else:
-                        # Cancel entry orders
-                        try:
-                            client.cancel_order(symbol, order["orderId"])
-                            cancelled_count += 1
-                        except:
-                            pass
+                # Keep protective orders, cancel entry orders
+                entry_orders = [order for order in open_orders if not order.get("reduceOnly")]
+                kept_count = len(open_orders) - len(entry_orders)
+                cancelled_count = _cancel_orders(client, symbol, entry_orders)
+                if not protection_rewritten:
+                    # Snapshot is still current: the open_* tools can skip refetching it
+                    _protective_orders[symbol] = [
+                        {"orderId": order["orderId"], "type": order.get("type")}
+                        for order in open_orders
+                        if order.get("reduceOnly")
+                    ]
                 actions_taken.append(
                     f"Cleaned {cancelled_count} entry orders, kept {kept_count} protective orders"
                 )
@@ -1777,13 +2342,7 @@ def prepare_trading_environment(
         else:
             # Scenario C: No position → cancel all orders (clean slate)
             try:
-                cancelled_count = 0
-                for order in open_orders:
-                    try:
-                        client.cancel_order(symbol, order["orderId"])
-                        cancelled_count += 1
-                    except:
-                        pass
+                cancelled_count = _cancel_all_known(client, symbol, open_orders, protection_rewritten)
                 actions_taken.append(f"No position: cancelled all {cancelled_count} orders")
             except Exception as e:
                 warnings.append(f"Failed to cancel orders: {str(e)}")
@@ -1799,15 +2358,11 @@ def prepare_trading_environment(
         account_equity = 0
         if has_position and positions:
             account_equity = float(positions[0].get("margin_balance", 0))
-        else:
-            # Get from account info if no position
-            try:
-                account_data = client.get_account()
-                account_equity = account_data.get("total_wallet_balance", 0) + account_data.get("total_unrealized_profit", 0)
-            except:
-                pass
+        elif not isinstance(account_data, Exception):
+            # Get from account info if no position (fetched with the positions above)
+            account_equity = account_data.get("total_wallet_balance", 0) + account_data.get("total_unrealized_profit", 0)
         
-        return json.dumps({
+        return to_json({
             "ready": ready,
             "status": {
                 "has_position": has_position,
@@ -1819,12 +2374,14 @@ def prepare_trading_environment(
             "actions_taken": actions_taken,
             "warnings": warnings,
             "recommendation": recommendation
-        }, indent=2)
+        })
         
     except Exception as e:
-        logger.error(f"Error preparing trading environment: {str(e)}")
-        return json.dumps({
+        logger.opt(exception=e).error("Error preparing trading environment: {}", e)
+        return to_json({
             "ready": False,
             "error": f"Unexpected error: {str(e)}",
             "requires_agent_decision": True
-        }, indent=2)
+        })
+    finally:
+        _close_read_scope(read_scope)
@@ -5,12 +5,13 @@ Provides helper functions required for futures market analysis.
 """
 
 from langchain_core.tools import tool
-import json
 import numpy as np
 import pandas as pd
 import pandas_ta as ta
 from typing import List, Dict
-from tradingagents.dataflows.asterdex_futures_api import AsterFuturesClient
+from loguru import logger
+from tradingagents.dataflows.asterdex_futures_api import AsterFuturesClient, get_shared_client
+from tradingagents.agents.utils.tool_output import to_json
 
 
 # Global client instance - will be set during initialization
@@ -27,7 +28,9 @@ def initialize_futures_client(api_key: str, api_secret: str, base_url: str = "ht
         base_url: Exchange API base URL
     """
     global _client
-    _client = AsterFuturesClient(api_key=api_key, api_secret=api_secret, base_url=base_url)
+    # Same instance as the execution tools: one connection pool, filter cache
+    # and rate-limit state per process, reused across rounds
+    _client = get_shared_client(api_key=api_key, api_secret=api_secret, base_url=base_url)
 
 
 def get_futures_client() -> AsterFuturesClient:
@@ -37,13 +40,13 @@ def get_futures_client() -> AsterFuturesClient:
     Raises:
         RuntimeError: If client hasn't been initialized
     """
-    global _client
-    if _client is None:
+    client = _client
+    if client is None:
         raise RuntimeError(
             "Futures client not initialized. "
             "Call initialize_futures_client() before using market tools."
         )
-    return _client
+    return client
 
 
 def calculate_atr(klines: List[Dict], period: int = 14) -> float:
@@ -257,10 +260,10 @@ def get_futures_market_data(symbol: str, interval: str = "1h", limit: int = 200)
             "recent_klines": klines[-20:],  # Last 20 klines
         }
         
-        return json.dumps(result, indent=2)
+        return to_json(result)
         
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return to_json({"error": str(e)})
 
 
 @tool
@@ -282,7 +285,7 @@ def get_futures_technical_features(symbol: str, interval: str = "1h") -> str:
         klines = client.get_klines(symbol, interval, 250)
         
         if len(klines) < 50:
-            return json.dumps({"error": "Insufficient data"})
+            return to_json({"error": "Insufficient data"})
         
         # Extract price components
         closes = [k["close"] for k in klines]
@@ -329,10 +332,10 @@ def get_futures_technical_features(symbol: str, interval: str = "1h") -> str:
             }
         }
         
-        return json.dumps(result, indent=2)
+        return to_json(result)
         
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return to_json({"error": str(e)})
 
 
 @tool
@@ -353,7 +356,7 @@ def get_funding_rate_analysis(symbol: str) -> str:
         funding_history = client.get_funding_rate_history(symbol, limit=24)  # Latest 24 periods
         
         if not funding_history:
-            return json.dumps({"error": "No funding rate data"})
+            return to_json({"error": "No funding rate data"})
         
         # Current funding rate
         current_funding = float(funding_history[-1]["fundingRate"])
@@ -387,10 +390,10 @@ def get_funding_rate_analysis(symbol: str) -> str:
             "recent_history": funding_history[-8:]  # Most recent 8 entries
         }
         
-        return json.dumps(result, indent=2)
+        return to_json(result)
         
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return to_json({"error": str(e)})
 
 
 @tool
@@ -456,10 +459,10 @@ def get_exchange_trading_rules(symbol: str) -> str:
             "note": f"These are hard exchange limits from /fapi/v1/exchangeInfo (futures API). Orders must satisfy BOTH min_notional (${min_notional}) and min_qty. Use current price to calculate the effective minimum. If min_notional seems too low, verify the API response contains 'NOTIONAL' filter (not 'MIN_NOTIONAL')."
         }
         
-        return json.dumps(result, indent=2)
+        return to_json(result)
         
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return to_json({"error": str(e)})
 
 
 @tool
@@ -500,10 +503,10 @@ def get_open_interest_analysis(symbol: str) -> str:
         else:
             result["interpretation"] = "Price relatively stable."
         
-        return json.dumps(result, indent=2)
+        return to_json(result)
         
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return to_json({"error": str(e)})
 
 
 @tool
@@ -550,7 +553,7 @@ def get_comprehensive_market_analysis(
         primary_klines = client.get_klines(symbol, primary_interval, 250)
         
         if len(primary_klines) < 50:
-            return json.dumps({"error": "Insufficient data for primary interval"})
+            return to_json({"error": "Insufficient data for primary interval"})
         
         # Extract basic price info from primary timeframe
         primary_closes = [k["close"] for k in primary_klines]
@@ -779,35 +782,43 @@ def get_comprehensive_market_analysis(
         }
         
         # Log summary of the comprehensive analysis
-        from loguru import logger
-        logger.info(f"📊 Comprehensive Market Analysis for {symbol}:")
-        logger.info(f"  Primary Interval: {primary_interval}")
-        logger.info(f"  Current Price: ${current_price:,.2f}")
-        logger.info(f"  24h Change: {price_change_pct}%")
-        logger.info(f"  24h Volume: {float(ticker_24hr.get('volume', 0)):,.2f}")
+        # (loguru brace arguments: nothing is formatted when INFO is disabled)
+        logger.info("📊 Comprehensive Market Analysis for {}:", symbol)
+        logger.info("  Primary Interval: {}", primary_interval)
+        logger.info("  Current Price: ${:,.2f}", current_price)
+        logger.info("  24h Change: {}%", price_change_pct)
+        logger.info("  24h Volume: {:,.2f}", float(ticker_24hr.get('volume', 0)))
         
         # Timeframes analyzed
-        timeframes = list(timeframe_analysis.keys())
-        logger.info(f"  Timeframes Analyzed: {', '.join(timeframes)}")
+        logger.info("  Timeframes Analyzed: {}", ", ".join(timeframe_analysis))
         
         # Orderbook summary
         if orderbook_analysis and 'spread' in orderbook_analysis:
             spread = orderbook_analysis.get('spread', {})
             imbalance = orderbook_analysis.get('imbalance', {})
             liquidity = orderbook_analysis.get('liquidity', {})
-            logger.info(f"  Orderbook Spread: ${spread.get('spread_absolute', 'N/A')} ({spread.get('spread_pct', 0):.4f}%)")
-            logger.info(f"  Order Pressure: {imbalance.get('pressure', 'N/A')} (Ratio: {imbalance.get('volume_ratio', 0):.2f}:1)")
+            logger.info(
+                "  Orderbook Spread: ${} ({:.4f}%)",
+                spread.get('spread_absolute', 'N/A'), spread.get('spread_pct', 0)
+            )
+            logger.info(
+                "  Order Pressure: {} (Ratio: {:.2f}:1)",
+                imbalance.get('pressure', 'N/A'), imbalance.get('volume_ratio', 0)
+            )
             total_liq = liquidity.get('bid_value_1pct', 0) + liquidity.get('ask_value_1pct', 0)
-            logger.info(f"  Liquidity (1%): {liquidity.get('assessment', 'N/A')} (${total_liq:,.0f})")
+            logger.info("  Liquidity (1%): {} (${:,.0f})", liquidity.get('assessment', 'N/A'), total_liq)
         elif orderbook_analysis and 'error' in orderbook_analysis:
             logger.warning(f"  Orderbook: {orderbook_analysis['error']}")
         
         # Funding & OI
-        logger.info(f"  Funding Rate: {funding_analysis.get('current_funding_rate_pct', 0):.4f}% ({funding_analysis.get('trend', 'N/A')})")
-        logger.info(f"  Open Interest: {open_interest_analysis.get('open_interest', 0):,.2f}")
-        logger.info(f"  K-lines: {len(primary_klines[-20:])} bars included")
+        logger.info(
+            "  Funding Rate: {:.4f}% ({})",
+            funding_analysis.get('current_funding_rate_pct', 0), funding_analysis.get('trend', 'N/A')
+        )
+        logger.info("  Open Interest: {:,.2f}", open_interest_analysis.get('open_interest', 0))
+        logger.info("  K-lines: {} bars included", min(len(primary_klines), 20))
         
-        return json.dumps(result, indent=2)
+        return to_json(result)
         
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return to_json({"error": str(e)})
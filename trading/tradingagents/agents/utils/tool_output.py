@@ -0,0 +1,23 @@
+"""
+Serialization shared by the futures tool modules.
+
+Tool results are read by the LLM, not humans: compact output keeps the C
+encoder fast path (indent= forces the pure-Python one) and saves prompt tokens.
+FUTURES_TOOLS_PRETTY=1 restores indentation when debugging by hand.
+"""
+
+import json
+import os
+
+
+PRETTY = os.getenv("FUTURES_TOOLS_PRETTY") == "1"
+RESULT_ENCODER = (
+    json.JSONEncoder(ensure_ascii=False, indent=2)
+    if PRETTY
+    else json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+)
+
+
+def to_json(obj) -> str:
+    """Serialize a tool result to JSON."""
+    return RESULT_ENCODER.encode(obj)
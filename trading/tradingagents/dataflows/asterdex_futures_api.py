@@ -7,18 +7,179 @@ Reference: https://github.com/asterdex/api-docs/blob/master/aster-finance-future
 
 import hmac
 import hashlib
+import json
 import time
 import random
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Union
+from urllib.parse import urlencode
 from decimal import Decimal, ROUND_HALF_UP, ROUND_DOWN
 import os
 from loguru import logger
 
 
+class CircuitOpenError(Exception):
+    """Raised without touching the network while an endpoint's circuit is open"""
+
+
+class _CircuitBreaker:
+    """
+    Per-endpoint circuit breaker (closed -> open -> half-open).
+    
+    Only transport failures (timeouts, connection errors, 5xx) count; an order
+    rejected with a 4xx means the exchange is answering, so it resets the count.
+    """
+    
+    def __init__(self, name: str, fail_max: int, reset_timeout: float):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+    
+    def before_call(self) -> None:
+        """Fail fast while open; let a single probe through once reset_timeout has passed."""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self._opened_at + self.reset_timeout - time.monotonic()
+            if remaining > 0 or self._probing:
+                raise CircuitOpenError(
+                    f"circuit_open: {self.name} is failing, retry in {max(remaining, 0):.1f}s"
+                )
+            self._probing = True
+    
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+    
+    def record_success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("✅ Circuit closed: {}", self.name)
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+    
+    def release_probe(self) -> None:
+        """End a probe without a verdict (non-transport error); the next call probes again."""
+        with self._lock:
+            self._probing = False
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.fail_max:
+                if self._opened_at is None or self._probing:
+                    logger.warning(
+                        f"⚠️ Circuit opened: {self.name} after {self._failures} failures, "
+                        f"failing fast for {self.reset_timeout:.0f}s"
+                    )
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket: holds up to `capacity` tokens, refilled continuously
+    at `capacity / period` per second; acquire() blocks until enough are available.
+    """
+    
+    def __init__(self, capacity: float, period: float):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens: float = 1) -> None:
+        tokens = min(tokens, self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            logger.debug("Request weight budget exhausted, waiting {:.2f}s", wait)
+            time.sleep(wait)
+
+
+class SharedTokenBucket:
+    """
+    Token bucket whose state lives in shared memory, so several processes draw
+    from one budget. Create it with the pool's multiprocessing context and hand
+    it to workers through the pool initializer.
+    """
+    
+    def __init__(self, capacity: float, period: float, ctx):
+        self.capacity = capacity
+        self.rate = capacity / period
+        # [tokens, last refill time]; time.monotonic() is system-wide on Linux and macOS
+        self._state = ctx.Array("d", [capacity, time.monotonic()])
+    
+    def acquire(self, tokens: float = 1) -> None:
+        tokens = min(tokens, self.capacity)
+        while True:
+            with self._state.get_lock():
+                now = time.monotonic()
+                available = min(self.capacity, self._state[0] + (now - self._state[1]) * self.rate)
+                self._state[1] = now
+                if available >= tokens:
+                    self._state[0] = available - tokens
+                    return
+                self._state[0] = available
+                wait = (tokens - available) / self.rate
+            logger.debug("Request weight budget exhausted, waiting {:.2f}s", wait)
+            time.sleep(wait)
+
+
+# The exchange meters request weight per IP (2400 per minute); every client in
+# the process draws from one budget so bursts are smoothed locally instead of
+# earning 429/418 backoffs. Multi-account workers share one IP, so the
+# orchestrator replaces this with a cross-process bucket (see
+# create_shared_request_weight_bucket).
+REQUEST_WEIGHT_LIMIT = 2400
+REQUEST_WEIGHT_PERIOD = 60.0
+_REQUEST_WEIGHT_BUCKET = _TokenBucket(capacity=REQUEST_WEIGHT_LIMIT, period=REQUEST_WEIGHT_PERIOD)
+
+
+def create_shared_request_weight_bucket(ctx) -> SharedTokenBucket:
+    """Create the per-IP request weight budget for all worker processes of a pool."""
+    return SharedTokenBucket(REQUEST_WEIGHT_LIMIT, REQUEST_WEIGHT_PERIOD, ctx)
+
+
+def use_request_weight_bucket(bucket: SharedTokenBucket) -> None:
+    """Make every client in this process draw request weight from bucket."""
+    global _REQUEST_WEIGHT_BUCKET
+    _REQUEST_WEIGHT_BUCKET = bucket
+
+
 class AsterFuturesClient:
     """Aster Futures REST API Client"""
     
+    # Exchange trading rules change rarely; refresh cached symbol filters hourly
+    SYMBOL_FILTERS_TTL = 3600.0
+    
+    # Consecutive transport failures that open an endpoint's circuit, and how long
+    # it then fails fast before letting a probe request through
+    CIRCUIT_FAIL_MAX = 5
+    CIRCUIT_RESET_TIMEOUT = 10.0
+    
+    # Extra attempts for transient transport failures (timeouts, dropped
+    # connections, 5xx), separate from the 429 retries governed by max_retries
+    TRANSIENT_RETRIES = 2
+    
+    # Tick and step sizes have at most 8 decimals: prices and quantities are
+    # quantized as integer counts of 1e-8 units, exact and without float division
+    STEP_UNITS = 10 ** 8
+    
     def __init__(
         self, 
         api_key: str, 
@@ -54,14 +215,65 @@ class AsterFuturesClient:
         self.session = requests.Session()
         self.session.headers.update({
             "Content-Type": "application/json",
+            "Connection": "keep-alive",
             "X-MBX-APIKEY": self.api_key  # Use the Binance-standard header name
         })
+        # Pooled keep-alive connections: tools fan out several requests at once,
+        # so keep enough warm sockets per host to avoid fresh TLS handshakes
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         
         # Local cache
         self._symbol_filters = {}
+        self._symbol_filters_loaded_at = 0.0
+        self._symbol_filters_lock = threading.Lock()
         self._leverage_brackets = {}
         self._last_sync_time = 0
         
+        # Keep-alive pinger state (see start_keepalive)
+        self._last_request_time = 0.0
+        self._keepalive_stop: Optional[threading.Event] = None
+        
+        # Circuit breakers keyed by "METHOD /endpoint" (see _breaker_for)
+        self._breakers: Dict[str, _CircuitBreaker] = {}
+        self._breakers_lock = threading.Lock()
+        
+    def start_keepalive(self, interval: float = 30.0) -> None:
+        """
+        Ping the exchange from a daemon thread whenever the session has been idle.
+        
+        Keeps a pooled connection from being closed by the server between agent
+        steps and rounds, so the next real request does not pay a new TCP+TLS
+        handshake. Pings are skipped while regular traffic keeps the session busy.
+        
+        Args:
+            interval: Idle seconds before a ping is sent.
+        """
+        if self._keepalive_stop is not None:
+            return
+        
+        stop = threading.Event()
+        self._keepalive_stop = stop
+        
+        def _ping_loop():
+            while not stop.wait(interval):
+                if time.monotonic() - self._last_request_time < interval:
+                    continue
+                try:
+                    self.session.get(f"{self.base_url}/fapi/v1/ping", timeout=self.timeout)
+                    self._last_request_time = time.monotonic()
+                except Exception as e:
+                    logger.debug("Keep-alive ping failed: {}", e)
+        
+        threading.Thread(target=_ping_loop, name="aster-keepalive", daemon=True).start()
+    
+    def stop_keepalive(self) -> None:
+        """Stop the keep-alive pinger, if running."""
+        if self._keepalive_stop is not None:
+            self._keepalive_stop.set()
+            self._keepalive_stop = None
+        
     def _generate_signature(self, params: Dict) -> str:
         """
         Generate request signature
@@ -75,7 +287,9 @@ class AsterFuturesClient:
         # ⚠️ CRITICAL: Aster DEX does NOT require sorted parameters!
         # Unlike standard Binance API, Asterdex uses insertion order
         # Tested and confirmed: sorting causes signature validation to fail
-        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
+        # urlencode keeps insertion order and signs the same bytes requests sends,
+        # which matters for JSON-valued params such as batchOrders
+        query_string = urlencode(params)
         signature = hmac.new(
             self.api_secret.encode('utf-8'),
             query_string.encode('utf-8'),
@@ -109,26 +323,63 @@ class AsterFuturesClient:
         
         return int(time.time() * 1000) + getattr(self, 'time_offset', 0)
     
-    def _request(self, method: str, endpoint: str, signed: bool = False, **kwargs) -> Dict:
+    def _breaker_for(self, method: str, endpoint: str) -> _CircuitBreaker:
+        """Return the circuit breaker for an endpoint, creating it on first use"""
+        key = f"{method} {endpoint}"
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._breakers_lock:
+                breaker = self._breakers.setdefault(
+                    key, _CircuitBreaker(key, self.CIRCUIT_FAIL_MAX, self.CIRCUIT_RESET_TIMEOUT)
+                )
+        return breaker
+    
+    def _transient_retry_delay(
+        self, method: str, error: Exception, failures: int, breaker: _CircuitBreaker
+    ) -> Optional[float]:
+        """
+        Backoff before retrying a transient failure, or None if it must not be retried.
+        
+        GET and DELETE (reads, cancels) are safe to repeat. A POST is only retried when
+        the connection was never established, since an order that timed out mid-flight
+        may already be live on the exchange.
+        """
+        if failures >= self.TRANSIENT_RETRIES or breaker.is_open:
+            return None
+        if method not in ("GET", "DELETE") and not isinstance(error, requests.exceptions.ConnectTimeout):
+            return None
+        # Exponential backoff with jitter: ~50ms, ~100ms, capped at 500ms
+        return min(0.05 * (2 ** failures) + random.uniform(0, 0.05), 0.5)
+    
+    def _request(self, method: str, endpoint: str, signed: bool = False, weight: int = 1, **kwargs) -> Dict:
         """
-        Generic request method with retry logic for rate limits
+        Generic request method with retry logic for rate limits and transient failures
         
         Args:
             method: HTTP method (GET/POST/DELETE)
             endpoint: API endpoint
             signed: Whether signature is required
+            weight: Request weight the exchange charges for this call
             **kwargs: Additional parameters
             
         Returns:
             Response data
             
         Raises:
+            CircuitOpenError: While the endpoint's circuit is open (no request sent)
             requests.exceptions.HTTPError: For non-retryable HTTP errors
             Exception: For other request exceptions
         """
         url = f"{self.base_url}{endpoint}"
-        
-        for attempt in range(self.max_retries + 1):
+        breaker = self._breaker_for(method, endpoint)
+        breaker.before_call()
+        transient_failures = 0
+        rate_limit_retries = 0
+        
+        for attempt in range(self.max_retries + 1 + self.TRANSIENT_RETRIES):
+            # Every attempt is charged; wait before signing so the timestamp stays fresh
+            _REQUEST_WEIGHT_BUCKET.acquire(weight)
+            
             # Refresh signature for each attempt if signed request
             if signed:
                 params = kwargs.get('params', {})
@@ -146,7 +397,9 @@ class AsterFuturesClient:
                     kwargs['timeout'] = self.timeout
                 
                 response = self.session.request(method, url, **kwargs)
+                self._last_request_time = time.monotonic()
                 response.raise_for_status()
+                breaker.record_success()
                 return response.json()
                 
             except requests.exceptions.HTTPError as e:
@@ -154,7 +407,7 @@ class AsterFuturesClient:
                 
                 # Handle 429 rate limit errors
                 if response.status_code == 429:
-                    if attempt < self.max_retries:
+                    if rate_limit_retries < self.max_retries:
                         # Calculate retry delay
                         retry_after = response.headers.get('Retry-After')
                         if retry_after:
@@ -162,45 +415,83 @@ class AsterFuturesClient:
                                 delay = float(retry_after)
                             except ValueError:
                                 # If Retry-After is not a number, use exponential backoff
-                                delay = self.retry_delay * (2 ** attempt)
+                                delay = self.retry_delay * (2 ** rate_limit_retries)
                         else:
                             # Exponential backoff with jitter
-                            delay = self.retry_delay * (2 ** attempt)
+                            delay = self.retry_delay * (2 ** rate_limit_retries)
                         
                         # Add jitter (±20% random variation)
                         jitter = delay * 0.2 * (2 * random.random() - 1)
                         delay = delay + jitter
+                        rate_limit_retries += 1
                         
                         logger.warning(
                             f"⚠️ Rate limit hit (429) on {method} {endpoint}. "
-                            f"Retry {attempt + 1}/{self.max_retries} after {delay:.2f}s"
+                            f"Retry {rate_limit_retries}/{self.max_retries} after {delay:.2f}s"
                         )
                         time.sleep(delay)
                         continue
                     else:
+                        breaker.record_success()
                         logger.error(
                             f"❌ Rate limit exceeded after {self.max_retries} retries on {method} {endpoint}"
                         )
                         logger.error(f"Response: {response.text}")
                         raise
                 
-                # For non-429 errors, log and raise immediately
+                # For non-429 errors, log and raise immediately; only 5xx means the
+                # exchange itself is struggling
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                    delay = self._transient_retry_delay(method, e, transient_failures, breaker)
+                    if delay is not None:
+                        transient_failures += 1
+                        logger.warning(
+                            f"⚠️ {response.status_code} on {method} {endpoint}, "
+                            f"retry {transient_failures}/{self.TRANSIENT_RETRIES} after {delay:.2f}s"
+                        )
+                        time.sleep(delay)
+                        continue
+                else:
+                    breaker.record_success()
                 logger.error(f"API request failed: {e}")
                 logger.error(f"Response: {response.text}")
                 raise
                 
             except requests.exceptions.Timeout as e:
                 # Handle timeout errors
+                breaker.record_failure()
+                delay = self._transient_retry_delay(method, e, transient_failures, breaker)
+                if delay is not None:
+                    transient_failures += 1
+                    logger.warning(
+                        f"⚠️ Timeout on {method} {endpoint}, "
+                        f"retry {transient_failures}/{self.TRANSIENT_RETRIES} after {delay:.2f}s"
+                    )
+                    time.sleep(delay)
+                    continue
                 logger.error(f"Request timeout after {self.timeout}s: {method} {endpoint}")
                 raise Exception(f"API request timeout after {self.timeout}s") from e
                 
             except requests.exceptions.ConnectionError as e:
                 # Handle connection errors
+                breaker.record_failure()
+                delay = self._transient_retry_delay(method, e, transient_failures, breaker)
+                if delay is not None:
+                    transient_failures += 1
+                    logger.warning(
+                        f"⚠️ Connection error on {method} {endpoint}, "
+                        f"retry {transient_failures}/{self.TRANSIENT_RETRIES} after {delay:.2f}s"
+                    )
+                    time.sleep(delay)
+                    continue
                 logger.error(f"Connection error: {method} {endpoint} - {e}")
                 raise Exception(f"API connection failed: {e}") from e
                 
             except Exception as e:
-                # For other non-HTTP errors (network issues, etc.), do not retry
+                # For other non-HTTP errors (bad response body, etc.), do not retry;
+                # they say nothing about the endpoint's health, so the breaker is untouched
+                breaker.release_probe()
                 logger.error(f"Request exception: {method} {endpoint} - {e}")
                 raise
         
@@ -227,7 +518,8 @@ class AsterFuturesClient:
             "limit": limit
         }
         
-        data = self._request("GET", "/fapi/v1/klines", params=params)
+        weight = 1 if limit < 100 else 2 if limit < 500 else 5 if limit <= 1000 else 10
+        data = self._request("GET", "/fapi/v1/klines", weight=weight, params=params)
         
         # Convert to a friendlier structure
         klines = []
@@ -333,7 +625,8 @@ class AsterFuturesClient:
             }
         """
         params = {"symbol": symbol, "limit": limit}
-        return self._request("GET", "/fapi/v1/depth", params=params)
+        weight = 2 if limit <= 50 else 5 if limit <= 100 else 10 if limit <= 500 else 20
+        return self._request("GET", "/fapi/v1/depth", weight=weight, params=params)
     
     # ==================== Exchange metadata endpoints ====================
     
@@ -353,6 +646,9 @@ class AsterFuturesClient:
         This fetches futures contract-specific trading rules from /fapi/v1/exchangeInfo.
         According to Aster DEX Futures API docs, futures use 'NOTIONAL' filter (not 'MIN_NOTIONAL').
         
+        One exchangeInfo response covers every symbol, so all of them are cached
+        together and refreshed after SYMBOL_FILTERS_TTL seconds.
+        
         Args:
             symbol: Trading pair.
             force_refresh: Whether to bypass the cache and fetch fresh data from API.
@@ -360,80 +656,109 @@ class AsterFuturesClient:
         Returns:
             Filter information including futures contract specs.
         """
-        if symbol in self._symbol_filters and not force_refresh:
+        if not force_refresh and self._symbol_filters_fresh(symbol):
             return self._symbol_filters[symbol]
         
-        exchange_info = self.get_exchange_info()
+        # Serialize refreshes: the background warm-up and a tool may ask at once
+        with self._symbol_filters_lock:
+            if force_refresh or not self._symbol_filters_fresh(symbol):
+                exchange_info = self.get_exchange_info()
+                self._symbol_filters = {
+                    s['symbol']: self._parse_symbol_filters(s, log_details=s['symbol'] == symbol)
+                    for s in exchange_info['symbols']
+                }
+                self._symbol_filters_loaded_at = time.monotonic()
+        
+        if symbol in self._symbol_filters:
+            return self._symbol_filters[symbol]
         
+        raise ValueError(f"Symbol {symbol} not found")
+    
+    def _symbol_filters_fresh(self, symbol: str) -> bool:
+        """Whether cached filters for symbol exist and are within the TTL."""
+        return (
+            symbol in self._symbol_filters
+            and time.monotonic() - self._symbol_filters_loaded_at < self.SYMBOL_FILTERS_TTL
+        )
+    
+    @staticmethod
+    def _parse_symbol_filters(s: Dict, log_details: bool = False) -> Dict:
+        """
+        Convert one exchangeInfo symbol entry into the filters dict.
         
-        for s in exchange_info['symbols']:
-            if s['symbol'] == symbol:
-                filters = {}
-                
-                # Contract specifications (futures-specific)
-                filters['contract_type'] = s.get('contractType', '')
-                filters['contract_size'] = float(s.get('contractSize', 1.0))
-                filters['contract_status'] = s.get('contractStatus', '')
-                filters['underlying_type'] = s.get('underlyingType', '')
-                
-                # Precision settings
-                filters['price_precision'] = int(s.get('pricePrecision', 0))
-                filters['quantity_precision'] = int(s.get('quantityPrecision', 0))
-                filters['base_asset_precision'] = int(s.get('baseAssetPrecision', 0))
-                filters['quote_precision'] = int(s.get('quotePrecision', 0))
-                
-                # Extract filter rules
-                # Note: Futures API uses 'NOTIONAL' filter (not 'MIN_NOTIONAL' like spot)
-                # Process NOTIONAL first (futures standard), then MIN_NOTIONAL as fallback
-                for f in s['filters']:
-                    filter_type = f['filterType']
-                    
-                    if filter_type == 'PRICE_FILTER':
-                        filters['tick_size'] = float(f['tickSize'])
-                        filters['min_price'] = float(f['minPrice'])
-                        filters['max_price'] = float(f['maxPrice'])
-                    elif filter_type == 'LOT_SIZE':
-                        filters['step_size'] = float(f['stepSize'])
-                        filters['min_qty'] = float(f['minQty'])
-                        filters['max_qty'] = float(f['maxQty'])
-                    elif filter_type == 'NOTIONAL':
-                        # Futures API standard: Aster DEX uses 'minNotional' field (Binance-compatible)
-                        # Try multiple possible field names
-                        min_notional_val = (
-                            f.get('minNotional') or 
-                            f.get('minNotionalValue') or
-                            f.get('notional') or 
-                            f.get('notionalValue')
-                        )
-                        if min_notional_val:
-                            filters['min_notional'] = float(min_notional_val)
-                        else:
-                            # Log warning if NOTIONAL filter exists but no minNotional found
-                            logger.warning(f"NOTIONAL filter found for {symbol} but no minNotional field. Filter keys: {list(f.keys())}")
-                        
-                        max_notional_val = f.get('maxNotional') or f.get('maxNotionalValue')
-                        if max_notional_val:
-                            filters['max_notional'] = float(max_notional_val)
-                    elif filter_type == 'MIN_NOTIONAL':
-                        # Spot API format - only use if NOTIONAL not found
-                        if 'min_notional' not in filters:
-                            filters['min_notional'] = float(f.get('notional', f.get('notionalValue', 0)))
-                    elif filter_type == 'MAX_NUM_ORDERS':
-                        filters['max_num_orders'] = int(f.get('maxNumOrders', 0))
-                    elif filter_type == 'MAX_NUM_ALGO_ORDERS':
-                        filters['max_num_algo_orders'] = int(f.get('maxNumAlgoOrders', 0))
-                    elif filter_type == 'PERCENT_PRICE':
-                        filters['multiplier_up'] = float(f.get('multiplierUp', 0))
-                        filters['multiplier_down'] = float(f.get('multiplierDown', 0))
-                        filters['multiplier_decimal'] = float(f.get('multiplierDecimal', 0))
-                    else:
-                        # Log unknown filter types for debugging
-                        logger.debug(f"Unknown filter type for {symbol}: {filter_type} = {f}")
+        Args:
+            s: Symbol entry from exchangeInfo.
+            log_details: Log filter anomalies (only for the symbol being traded,
+                to keep the bulk parse of every symbol quiet).
+        """
+        symbol = s['symbol']
+        filters = {}
+        
+        # Contract specifications (futures-specific)
+        filters['contract_type'] = s.get('contractType', '')
+        filters['contract_size'] = float(s.get('contractSize', 1.0))
+        filters['contract_status'] = s.get('contractStatus', '')
+        filters['underlying_type'] = s.get('underlyingType', '')
+        
+        # Precision settings
+        filters['price_precision'] = int(s.get('pricePrecision', 0))
+        filters['quantity_precision'] = int(s.get('quantityPrecision', 0))
+        filters['base_asset_precision'] = int(s.get('baseAssetPrecision', 0))
+        filters['quote_precision'] = int(s.get('quotePrecision', 0))
+        
+        # Extract filter rules
+        # Note: Futures API uses 'NOTIONAL' filter (not 'MIN_NOTIONAL' like spot)
+        # Process NOTIONAL first (futures standard), then MIN_NOTIONAL as fallback
+        for f in s['filters']:
+            filter_type = f['filterType']
+            
+            if filter_type == 'PRICE_FILTER':
+                filters['tick_size'] = float(f['tickSize'])
+                filters['tick_size_units'] = AsterFuturesClient._to_units(filters['tick_size'])
+                filters['min_price'] = float(f['minPrice'])
+                filters['max_price'] = float(f['maxPrice'])
+            elif filter_type == 'LOT_SIZE':
+                filters['step_size'] = float(f['stepSize'])
+                filters['step_size_units'] = AsterFuturesClient._to_units(filters['step_size'])
+                filters['min_qty'] = float(f['minQty'])
+                filters['max_qty'] = float(f['maxQty'])
+            elif filter_type == 'NOTIONAL':
+                # Futures API standard: Aster DEX uses 'minNotional' field (Binance-compatible)
+                # Try multiple possible field names
+                min_notional_val = (
+                    f.get('minNotional') or 
+                    f.get('minNotionalValue') or
+                    f.get('notional') or 
+                    f.get('notionalValue')
+                )
+                if min_notional_val:
+                    filters['min_notional'] = float(min_notional_val)
+                else:
+                    # Log warning if NOTIONAL filter exists but no minNotional found
+                    if log_details:
+                        logger.warning(f"NOTIONAL filter found for {symbol} but no minNotional field. Filter keys: {list(f.keys())}")
                 
-                self._symbol_filters[symbol] = filters
-                return filters
-        
-        raise ValueError(f"Symbol {symbol} not found")
+                max_notional_val = f.get('maxNotional') or f.get('maxNotionalValue')
+                if max_notional_val:
+                    filters['max_notional'] = float(max_notional_val)
+            elif filter_type == 'MIN_NOTIONAL':
+                # Spot API format - only use if NOTIONAL not found
+                if 'min_notional' not in filters:
+                    filters['min_notional'] = float(f.get('notional', f.get('notionalValue', 0)))
+            elif filter_type == 'MAX_NUM_ORDERS':
+                filters['max_num_orders'] = int(f.get('maxNumOrders', 0))
+            elif filter_type == 'MAX_NUM_ALGO_ORDERS':
+                filters['max_num_algo_orders'] = int(f.get('maxNumAlgoOrders', 0))
+            elif filter_type == 'PERCENT_PRICE':
+                filters['multiplier_up'] = float(f.get('multiplierUp', 0))
+                filters['multiplier_down'] = float(f.get('multiplierDown', 0))
+                filters['multiplier_decimal'] = float(f.get('multiplierDecimal', 0))
+            else:
+                # Log unknown filter types for debugging
+                if log_details:
+                    logger.debug("Unknown filter type for {}: {} = {}", symbol, filter_type, f)
+        
+        return filters
     
     def get_leverage_bracket(self, symbol: str = None, force_refresh: bool = False) -> Dict:
         """
@@ -464,7 +789,7 @@ class AsterFuturesClient:
             return data
         except Exception as e:
             # If endpoint doesn't exist, return empty structure
-            logger.debug(f"Leverage bracket endpoint not available: {e}")
+            logger.debug("Leverage bracket endpoint not available: {}", e)
             return []
 
     def _format_decimal(
@@ -497,16 +822,21 @@ class AsterFuturesClient:
     
     # ==================== Account and position endpoints ====================
     
-    def get_account(self) -> Dict:
+    def get_account(self, include_details: bool = False) -> Dict:
         """
         Fetch account information.
         
+        Args:
+            include_details: Also return the raw per-asset and per-symbol rows.
+                Off by default: callers only read the account totals, and the
+                positions array covers every listed symbol.
+            
         Returns:
             Account balances and margin metrics.
         """
-        data = self._request("GET", "/fapi/v2/account", signed=True)
+        data = self._request("GET", "/fapi/v2/account", signed=True, weight=5)
         
-        return {
+        account = {
             "total_wallet_balance": float(data["totalWalletBalance"]),
             "total_unrealized_profit": float(data["totalUnrealizedProfit"]),
             "total_margin_balance": float(data["totalMarginBalance"]),
@@ -514,9 +844,11 @@ class AsterFuturesClient:
             "total_open_order_initial_margin": float(data["totalOpenOrderInitialMargin"]),
             "available_balance": float(data["availableBalance"]),
             "max_withdraw_amount": float(data["maxWithdrawAmount"]),
-            "assets": data.get("assets", []),
-            "positions": data.get("positions", [])
         }
+        if include_details:
+            account["assets"] = data.get("assets", [])
+            account["positions"] = data.get("positions", [])
+        return account
     
     def get_positions(self, symbol: str = None) -> List[Dict]:
         """
@@ -532,7 +864,7 @@ class AsterFuturesClient:
         if symbol:
             params['symbol'] = symbol
         
-        data = self._request("GET", "/fapi/v2/positionRisk", signed=True, params=params)
+        data = self._request("GET", "/fapi/v2/positionRisk", signed=True, weight=5, params=params)
         
         positions = []
         for p in data:
@@ -603,11 +935,11 @@ class AsterFuturesClient:
         }
         return self._request("POST", "/fapi/v1/marginType", signed=True, params=params)
     
-    def place_order(
+    def _build_order_params(
         self,
         symbol: str,
-        side: str,  # "BUY" or "SELL"
-        order_type: str = "LIMIT",  # "LIMIT", "MARKET", "STOP", "TAKE_PROFIT"
+        side: str,
+        order_type: str = "LIMIT",
         quantity: float = None,
         price: float = None,
         stop_price: float = None,
@@ -617,21 +949,9 @@ class AsterFuturesClient:
         **kwargs
     ) -> Dict:
         """
-        Place an order.
+        Build exchange order parameters with quantity/price aligned to symbol filters.
         
-        Args:
-            symbol: Trading pair.
-            side: Direction ("BUY" opens long/closes short, "SELL" opens short/closes long).
-            order_type: Order type.
-            quantity: Order quantity.
-            price: Price (required for limit orders).
-            stop_price: Trigger price (required for stop orders).
-            reduce_only: Reduce-only flag.
-            time_in_force: Time-in-force ("GTC", "IOC", "FOK").
-            client_order_id: Optional client order id (for idempotency).
-            
-        Returns:
-            Order information.
+        Shared by place_order and place_batch_orders; see place_order for arguments.
         """
         params = {
             "symbol": symbol,
@@ -675,8 +995,79 @@ class AsterFuturesClient:
         # Append any additional parameters passed via kwargs
         params.update(kwargs)
         
+        return params
+    
+    def place_order(
+        self,
+        symbol: str,
+        side: str,  # "BUY" or "SELL"
+        order_type: str = "LIMIT",  # "LIMIT", "MARKET", "STOP", "TAKE_PROFIT"
+        quantity: float = None,
+        price: float = None,
+        stop_price: float = None,
+        reduce_only: bool = False,
+        time_in_force: str = "GTC",
+        client_order_id: str = None,
+        **kwargs
+    ) -> Dict:
+        """
+        Place an order.
+        
+        Args:
+            symbol: Trading pair.
+            side: Direction ("BUY" opens long/closes short, "SELL" opens short/closes long).
+            order_type: Order type.
+            quantity: Order quantity.
+            price: Price (required for limit orders).
+            stop_price: Trigger price (required for stop orders).
+            reduce_only: Reduce-only flag.
+            time_in_force: Time-in-force ("GTC", "IOC", "FOK").
+            client_order_id: Optional client order id (for idempotency).
+            
+        Returns:
+            Order information. Responses use newOrderRespType=RESULT, so a MARKET
+            order already carries its fill (status, executedQty, avgPrice) and
+            callers need not poll positions to learn the new size.
+        """
+        kwargs.setdefault("newOrderRespType", "RESULT")
+        params = self._build_order_params(
+            symbol=symbol,
+            side=side,
+            order_type=order_type,
+            quantity=quantity,
+            price=price,
+            stop_price=stop_price,
+            reduce_only=reduce_only,
+            time_in_force=time_in_force,
+            client_order_id=client_order_id,
+            **kwargs
+        )
         return self._request("POST", "/fapi/v1/order", signed=True, params=params)
     
+    def place_batch_orders(self, symbol: str, orders: List[Dict]) -> List[Dict]:
+        """
+        Place several orders for one symbol in a single request.
+        
+        Args:
+            symbol: Trading pair.
+            orders: List of order specs, each taking the place_order keyword
+                arguments (side, order_type, quantity, stop_price, ...).
+            
+        Returns:
+            One entry per order in submission order: the order information on
+            success, or an error object ({"code", "msg"}) if that order was rejected.
+        """
+        results = []
+        # The exchange accepts at most 5 orders per batch
+        for start in range(0, len(orders), 5):
+            batch = [
+                {k: str(v) for k, v in self._build_order_params(symbol=symbol, **order).items()}
+                for order in orders[start:start + 5]
+            ]
+            params = {"batchOrders": json.dumps(batch, separators=(",", ":"))}
+            results.extend(self._request("POST", "/fapi/v1/batchOrders", signed=True, weight=5, params=params))
+        return results
+    
     def cancel_order(self, symbol: str, order_id: int = None, client_order_id: str = None) -> Dict:
         """
         Cancel a specific order.
@@ -700,6 +1091,28 @@ class AsterFuturesClient:
         
         return self._request("DELETE", "/fapi/v1/order", signed=True, params=params)
     
+    def cancel_batch_orders(self, symbol: str, order_ids: List[int]) -> List[Dict]:
+        """
+        Cancel several orders for one symbol in a single request.
+        
+        Args:
+            symbol: Trading pair.
+            order_ids: Order identifiers to cancel.
+            
+        Returns:
+            One entry per order id: the cancelled order on success, or an error
+            object ({"code", "msg"}) if that order could not be cancelled.
+        """
+        results = []
+        # The exchange accepts at most 10 order ids per batch
+        for start in range(0, len(order_ids), 10):
+            params = {
+                "symbol": symbol,
+                "orderIdList": json.dumps([int(oid) for oid in order_ids[start:start + 10]], separators=(",", ":")),
+            }
+            results.extend(self._request("DELETE", "/fapi/v1/batchOrders", signed=True, params=params))
+        return results
+    
     def get_order(self, symbol: str, order_id: int = None, client_order_id: str = None) -> Dict:
         """
         Query an order.
@@ -737,7 +1150,10 @@ class AsterFuturesClient:
         if symbol:
             params["symbol"] = symbol
         
-        return self._request("GET", "/fapi/v1/openOrders", signed=True, params=params)
+        # Weight 1 for one symbol, 40 for all symbols
+        return self._request(
+            "GET", "/fapi/v1/openOrders", signed=True, weight=1 if symbol else 40, params=params
+        )
     
     def cancel_all_orders(self, symbol: str) -> Dict:
         """
@@ -761,11 +1177,14 @@ class AsterFuturesClient:
         quantity: float,
         stop_loss_price: float = None,
         take_profit_price: float = None,
-        trigger_type: str = "MARK_PRICE"  # "MARK_PRICE", "CONTRACT_PRICE", "INDEX_PRICE"
+        trigger_type: str = "MARK_PRICE",  # "MARK_PRICE", "CONTRACT_PRICE", "INDEX_PRICE"
+        raise_on_error: bool = True
     ) -> Dict:
         """
         Submit stop-loss and take-profit orders using mark price triggers.
         
+        Both legs go out in one batch request.
+        
         Args:
             symbol: Trading pair.
             side: Close direction ("SELL" to close long, "BUY" to close short).
@@ -773,49 +1192,60 @@ class AsterFuturesClient:
             stop_loss_price: Stop-loss price.
             take_profit_price: Take-profit price.
             trigger_type: Price type used for triggering.
+            raise_on_error: Raise if any leg is rejected; otherwise the error
+                objects ({"code", "msg"}) of rejected legs are reported under
+                "errors" and accepted legs are still returned.
             
         Returns:
             Order placement details.
         """
         filters = self.get_symbol_filters(symbol)
         tick_size = filters.get("tick_size")
-        tick_decimal = Decimal(str(tick_size)) if tick_size else None
+        tick_size_units = filters.get("tick_size_units")
 
         def _align_price(price: Optional[float]) -> Optional[float]:
-            if price is None or tick_decimal is None or tick_decimal <= 0:
+            if price is None or not tick_size or tick_size <= 0:
                 return price
-            return float(Decimal(str(price)).quantize(tick_decimal, rounding=ROUND_HALF_UP))
+            # Snap to a multiple of the tick (not just its decimal places, which
+            # would let e.g. 100.3 through for a 0.5 tick)
+            return self._snap_to_step(price, tick_size, tick_size_units)
 
         stop_loss_price = _align_price(stop_loss_price)
         take_profit_price = _align_price(take_profit_price)
 
         result = {"stop_loss": None, "take_profit": None}
         
-        # Place stop-loss order when requested
+        legs = []
         if stop_loss_price:
-            sl_order = self.place_order(
-                symbol=symbol,
-                side=side,
-                order_type="STOP_MARKET",
-                quantity=quantity,
-                stop_price=stop_loss_price,
-                reduce_only=True,
-                workingType=trigger_type
-            )
-            result["stop_loss"] = sl_order
-        
-        # Place take-profit order when requested
+            legs.append(("stop_loss", "STOP_MARKET", stop_loss_price))
         if take_profit_price:
-            tp_order = self.place_order(
-                symbol=symbol,
-                side=side,
-                order_type="TAKE_PROFIT_MARKET",
-                quantity=quantity,
-                stop_price=take_profit_price,
-                reduce_only=True,
-                workingType=trigger_type
-            )
-            result["take_profit"] = tp_order
+            legs.append(("take_profit", "TAKE_PROFIT_MARKET", take_profit_price))
+        if not legs:
+            return result
+        
+        responses = self.place_batch_orders(symbol, [
+            {
+                "side": side,
+                "order_type": order_type,
+                "quantity": quantity,
+                "stop_price": trigger_price,
+                "reduce_only": True,
+                "workingType": trigger_type,
+            }
+            for _, order_type, trigger_price in legs
+        ])
+        
+        errors = {}
+        for (leg, _, _), response in zip(legs, responses):
+            if "orderId" in response:
+                result[leg] = response
+            else:
+                errors[leg] = response
+        
+        if errors:
+            if raise_on_error:
+                raise Exception(f"SL/TP batch order rejected: {errors}")
+            result["errors"] = errors
         
         return result
     
@@ -855,27 +1285,70 @@ class AsterFuturesClient:
     
     # ==================== Helper methods ====================
     
-    def validate_order_params(self, symbol: str, price: float, quantity: float) -> Dict:
+    @classmethod
+    def _to_units(cls, value: float) -> int:
+        """Convert a price/quantity to an integer count of 1e-8 units."""
+        return round(value * cls.STEP_UNITS)
+    
+    @classmethod
+    def _snap_to_step(
+        cls,
+        value: float,
+        step: float,
+        step_units: Optional[int] = None,
+        round_up: bool = False
+    ) -> float:
+        """
+        Round value to a multiple of step (nearest, half-up; or up if round_up).
+        
+        Integer arithmetic on 1e-8 units, so no binary float drift: 0.07 / 0.01
+        is 7.000000000000001 in floats but exactly 7 steps here.
+        
+        Args:
+            value: Price or quantity to round.
+            step: Tick or step size.
+            step_units: Precomputed _to_units(step) from the symbol filters.
+            round_up: Round up instead of to nearest.
+        """
+        step_units = step_units or cls._to_units(step)
+        if step_units <= 0:
+            return value
+        value_units = cls._to_units(value)
+        if round_up:
+            multiple = -(-value_units // step_units)
+        else:
+            multiple = (2 * value_units + step_units) // (2 * step_units)
+        return multiple * step_units / cls.STEP_UNITS
+    
+    def validate_order_params(
+        self,
+        symbol: str,
+        price: float,
+        quantity: float,
+        filters: Optional[Dict] = None
+    ) -> Dict:
         """
         Validate order parameters against exchange filters.
         
+        Runs locally against the cached symbol filters; no request is made once
+        they are loaded.
+        
         Args:
             symbol: Trading pair.
             price: Proposed order price.
             quantity: Proposed order quantity.
+            filters: Symbol filters the caller already holds (fetched if omitted).
             
         Returns:
             Validation result and adjusted parameters.
         """
-        filters = self.get_symbol_filters(symbol)
+        filters = filters or self.get_symbol_filters(symbol)
         
         # Validate and adjust price
-        tick_size = filters['tick_size']
-        adjusted_price = round(price / tick_size) * tick_size
+        adjusted_price = self._snap_to_step(price, filters['tick_size'], filters.get('tick_size_units'))
         
         # Validate and adjust quantity
-        step_size = filters['step_size']
-        adjusted_quantity = round(quantity / step_size) * step_size
+        adjusted_quantity = self._snap_to_step(quantity, filters['step_size'], filters.get('step_size_units'))
         
         # Validate minimum notional
         notional = adjusted_price * adjusted_quantity
@@ -928,3 +1401,37 @@ class AsterFuturesClient:
             liq_price = entry_price * (1 + (1 / leverage) - maintenance_margin_rate)
         
         return liq_price
+
+
+_shared_client: Optional[AsterFuturesClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_client(
+    api_key: str,
+    api_secret: str,
+    base_url: str = "https://fapi.asterdex.com"
+) -> AsterFuturesClient:
+    """
+    Return the process-wide client for these credentials, creating it on first use.
+    
+    Market and execution tools share one instance, and with it one connection
+    pool, clock offset, filter cache and rate-limit state. A client with other
+    credentials is replaced (and its keep-alive pinger stopped).
+    """
+    global _shared_client
+    with _shared_client_lock:
+        client = _shared_client
+        if (
+            client is not None
+            and client.api_key == api_key
+            and client.api_secret == api_secret
+            and client.base_url == base_url
+        ):
+            return client
+        if client is not None:
+            client.stop_keepalive()
+        client = AsterFuturesClient(api_key=api_key, api_secret=api_secret, base_url=base_url)
+        client.start_keepalive()
+        _shared_client = client
+        return client
@@ -5,6 +5,7 @@ Provides the main trading loop and graph construction for the AI trading system.
 Uses LangGraph's init_chat_model for unified multi-provider LLM support.
 """
 
+import json
 import os
 import sqlite3
 import uuid
@@ -31,6 +32,7 @@ from tradingagents.agents.risk_manager.futures_risk_manager import create_risk_m
 from tradingagents.agents.portfolio_manager.futures_portfolio_manager import create_portfolio_manager
 from tradingagents.agents.trader.futures_trader import create_trader
 from tradingagents.agents.utils.agent_states import AgentState
+from tradingagents.agents.utils.analysis_recorder import flush_analysis_records
 
 from tradingagents.agents.utils.futures_market_tools import (
     initialize_futures_client as initialize_market_client,
@@ -58,6 +60,7 @@ from tradingagents.agents.utils.futures_execution_tools import (
 )
 from tradingagents.agents.utils.agent0_tools_a2a import (
     initialize_agent0_sdk,
+    clear_research_cache,
     discover_research_agents,
     invoke_research_agent,
 )
@@ -281,7 +284,8 @@ def run_trading_strategy(symbol: str, config: Optional[AccountConfig] = None):
     initialize_execution_client(
         api_key=config.exchange.api_key,
         api_secret=config.exchange.api_secret,
-        base_url=config.exchange.base_url
+        base_url=config.exchange.base_url,
+        prefetch_symbol=symbol,
     )
     logger.info(f"Exchange API initialized: {config.exchange.base_url}")
 
@@ -312,6 +316,9 @@ def run_trading_strategy(symbol: str, config: Optional[AccountConfig] = None):
     
     # Generate UUID for this trading round
     record_id = str(uuid.uuid4())
+    
+    # Research results are only reusable within a single round
+    clear_research_cache()
     logger.info(f"📝 Trading round ID: {record_id}")
     
     # Log test mode if configured
@@ -341,10 +348,11 @@ def run_trading_strategy(symbol: str, config: Optional[AccountConfig] = None):
         # Test mode (if configured)
         "test_mode": config.test_mode,  # Optional: force specific decisions for testing
 
-        # Configuration
+        # Configuration (1h primary: the timeframes research has always run with,
+        # since this key only reaches the nodes now that AgentState declares it)
         "market_timeframes": {
-            "primary": "5m",
-            "secondary": ["15m", "1h", "4h"],
+            "primary": "1h",
+            "secondary": ["5m", "15m"],
         },
     }
     
@@ -476,7 +484,6 @@ def run_trading_strategy(symbol: str, config: Optional[AccountConfig] = None):
                             if response_text:
                                 # Check for actual errors (not just JSON keys containing "error")
                                 # Parse as JSON first to detect real errors
-                                import json
                                 is_error = False
                                 try:
                                     data = json.loads(response_text)
@@ -541,3 +548,7 @@ def run_trading_strategy(symbol: str, config: Optional[AccountConfig] = None):
         import traceback
         traceback.print_exc()
         return None
+    
+    finally:
+        # Records are posted in the background; deliver them before the run ends
+        flush_analysis_records()